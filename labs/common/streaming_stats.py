@@ -0,0 +1,179 @@
+"""
+Single-pass descriptive statistics for columns that are read in chunks.
+
+StreamingStats keeps count, min, max, mean and variance (merged with the
+Chan et al. parallel formula) plus a KLL quantile sketch for the median and
+other percentiles. Every piece is mergeable, so statistics computed on
+separate chunks, files or worker processes can be combined.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch (Karnin, Lang & Liberty, 2016).
+
+    The rank error shrinks as k grows; k=200 gives about 1% normalized rank
+    error. Use KLLSketch.for_error(eps) to pick k from a target error.
+    Memory is O(k) regardless of how many values are added.
+    """
+
+    C = 2.0 / 3.0
+
+    def __init__(self, k=200, seed=0):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.n = 0
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def for_error(cls, rank_error, seed=0):
+        """Sketch sized for roughly the given normalized rank error (e.g. 0.01)."""
+        return cls(k=max(8, math.ceil(2.0 / rank_error)), seed=seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * self.C ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # Keep one item behind when the count is odd
+                keep = items[:1] if len(items) % 2 else items[:0]
+                items = items[len(keep):]
+                promoted = items[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.n += len(values)
+        # Feed large chunks in slices so level 0 never grows far past its capacity
+        step = max(self.k, 1) * 4
+        for start in range(0, len(values), step):
+            self.levels[0] = np.concatenate([self.levels[0], values[start:start + step]])
+            self._compress()
+        return self
+
+    def merge(self, other):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantiles(self, qs):
+        """Approximate quantiles for probabilities qs (scalar or sequence)."""
+        items = np.concatenate(self.levels)
+        if len(items) == 0:
+            return np.full(np.shape(qs), np.nan)
+        weights = np.concatenate([np.full(len(items), 2.0 ** level)
+                                  for level, items in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items, cum = items[order], np.cumsum(weights[order])
+        targets = np.asarray(qs, dtype=float) * cum[-1]
+        idx = np.minimum(np.searchsorted(cum, targets, side="left"), len(items) - 1)
+        return items[idx]
+
+
+class StreamingStats:
+    """
+    Min, max, mean, standard deviation and approximate quantiles in one pass.
+    """
+
+    def __init__(self, rank_error=0.01, seed=0):
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.sketch = KLLSketch.for_error(rank_error, seed=seed)
+
+    def update(self, values):
+        """Add a chunk of values (NaNs are ignored)."""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if n == 0:
+            return self
+
+        mean = values.mean()
+        m2 = ((values - mean) ** 2).sum()
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.sketch.update(values)
+        return self
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def std(self, ddof=1):
+        return math.sqrt(self.m2 / (self.count - ddof)) if self.count > ddof else math.nan
+
+    def quantile(self, q):
+        return self.sketch.quantiles(q)
+
+    def summary(self, percentiles=(0.25, 0.5, 0.75)):
+        """Dictionary in the same order as the lab2 statistics printout."""
+        stats = {
+            "Minimum": self.min,
+            "Maximum": self.max,
+            "Mean": self.mean,
+            "Median": float(self.quantile(0.5)),
+            "Standard Deviation": self.std(),
+        }
+        for q in percentiles:
+            if q != 0.5:
+                stats[f"P{q * 100:g}"] = float(self.quantile(q))
+        return stats
+
+
+def describe_csv(file_path, column, chunksize=1_000_000, by=None, rank_error=0.01):
+    """
+    Stream a CSV once and return StreamingStats for `column`.
+
+    With by=<column> a {group: StreamingStats} dictionary is returned instead,
+    e.g. one entry per traffic lane.
+    """
+    usecols = [column] if by is None else [by, column]
+    if by is None:
+        stats = StreamingStats(rank_error)
+        for chunk in pd.read_csv(file_path, usecols=usecols, chunksize=chunksize):
+            stats.update(chunk[column].to_numpy())
+        return stats
+
+    groups = {}
+    for chunk in pd.read_csv(file_path, usecols=usecols, chunksize=chunksize):
+        for key, values in chunk.groupby(by)[column]:
+            groups.setdefault(key, StreamingStats(rank_error)).update(values.to_numpy())
+    return groups
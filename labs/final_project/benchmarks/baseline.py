@@ -0,0 +1,186 @@
+"""
+Performance baselines for the LCA pipeline benchmarks.
+
+Records median/IQR timings and peak memory per benchmark into a versioned
+JSON file and compares new runs against it, flagging regressions.
+
+Usage:
+    python -m benchmarks.baseline record --sizes 1k 100k --repeat 7
+    python -m benchmarks.baseline compare --sizes 1k 100k --repeat 7 --threshold 0.10
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.run_benchmarks import run_suite
+
+SCHEMA_VERSION = 1
+DEFAULT_BASELINE = Path(__file__).parent / 'baselines.json'
+
+
+def summarize(report: Dict) -> Dict[str, Dict]:
+    """
+    Reduce a benchmark report to per-benchmark statistics.
+
+    Args:
+        report: Output of run_suite (or a benchmarks JSON file)
+
+    Returns:
+        Mapping of "name@size" to median/IQR wall time and peak memory
+    """
+    summary = {}
+    for record in report['results']:
+        times = np.asarray(record['wall_s'], dtype=float)
+        q1, median, q3 = np.percentile(times, [25, 50, 75])
+        summary[f"{record['name']}@{record['size']}"] = {
+            'rows': record['rows'],
+            'runs': len(times),
+            'median_s': float(median),
+            'iqr_s': float(q3 - q1),
+            'peak_mem_bytes': record.get('peak_mem_bytes')
+        }
+    return summary
+
+
+def save_baseline(summary: Dict[str, Dict], file_path: Path, meta: Optional[Dict] = None) -> None:
+    """
+    Write a baseline file, merging into any benchmarks already recorded there.
+    """
+    baseline = {'schema_version': SCHEMA_VERSION, 'benchmarks': {}}
+    if file_path.exists():
+        baseline = load_baseline(file_path)
+
+    baseline['meta'] = dict(meta or {}, recorded=datetime.now(timezone.utc).isoformat())
+    baseline['benchmarks'].update(summary)
+
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, 'w') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+
+
+def load_baseline(file_path: Path) -> Dict:
+    """
+    Read a baseline file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file was written with a different schema version
+    """
+    if not file_path.exists():
+        raise FileNotFoundError(f"Baseline file not found: {file_path}")
+    with open(file_path, 'r') as f:
+        baseline = json.load(f)
+    if baseline.get('schema_version') != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported baseline schema version: {baseline.get('schema_version')}")
+    return baseline
+
+
+def compare(baseline: Dict[str, Dict], current: Dict[str, Dict], threshold: float = 0.10,
+            memory_threshold: Optional[float] = 0.20) -> List[Dict]:
+    """
+    Compare current statistics against a baseline.
+
+    A benchmark regresses when its median is more than `threshold` slower than
+    the baseline median and the difference is larger than the IQR of either
+    run, so that ordinary noise is not reported.
+
+    Args:
+        baseline: Baseline statistics per benchmark
+        current: Current statistics per benchmark
+        threshold: Allowed relative slowdown (0.10 = 10%)
+        memory_threshold: Allowed relative peak memory growth (None to ignore memory)
+
+    Returns:
+        One comparison row per benchmark present in both
+    """
+    rows = []
+    for key in sorted(set(baseline) & set(current)):
+        base, cur = baseline[key], current[key]
+        ratio = cur['median_s'] / base['median_s'] if base['median_s'] > 0 else float('inf')
+        noise = max(base['iqr_s'], cur['iqr_s'])
+        slower = ratio > 1 + threshold and cur['median_s'] - base['median_s'] > noise
+
+        mem_ratio = None
+        grew = False
+        if base.get('peak_mem_bytes') and cur.get('peak_mem_bytes') is not None:
+            mem_ratio = cur['peak_mem_bytes'] / base['peak_mem_bytes']
+            grew = memory_threshold is not None and mem_ratio > 1 + memory_threshold
+
+        rows.append({
+            'benchmark': key,
+            'baseline_s': base['median_s'],
+            'current_s': cur['median_s'],
+            'ratio': ratio,
+            'noise_s': noise,
+            'mem_ratio': mem_ratio,
+            'regression': slower or grew
+        })
+    return rows
+
+
+def format_comparison(rows: List[Dict]) -> str:
+    lines = [f"{'benchmark':<34} {'baseline':>10} {'current':>10} {'ratio':>7} {'mem':>6}  status"]
+    for row in rows:
+        mem = f"{row['mem_ratio']:.2f}" if row['mem_ratio'] is not None else '-'
+        lines.append(f"{row['benchmark']:<34} {row['baseline_s']:>9.4f}s {row['current_s']:>9.4f}s "
+                     f"{row['ratio']:>7.2f} {mem:>6}  {'REGRESSION' if row['regression'] else 'ok'}")
+    return '\n'.join(lines)
+
+
+def _current_report(args: argparse.Namespace) -> Dict:
+    if args.results:
+        with open(args.results, 'r') as f:
+            return json.load(f)
+    return run_suite(args.sizes, Path(args.data_dir), repeat=args.repeat,
+                     memory=not args.no_memory, plots=not args.no_plots, seed=args.seed)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Record and compare LCA benchmark baselines.')
+    parser.add_argument('command', choices=['record', 'compare'])
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='Baseline JSON file')
+    parser.add_argument('--results', help='Use an existing benchmarks JSON instead of running the suite')
+    parser.add_argument('--sizes', nargs='+', default=['1k', '100k'])
+    parser.add_argument('--data-dir', default='data/synthetic')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per benchmark')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--threshold', type=float, default=0.10, help='Allowed relative slowdown')
+    parser.add_argument('--memory-threshold', type=float, default=0.20,
+                        help='Allowed relative peak memory growth')
+    parser.add_argument('--no-memory', action='store_true', help='Skip memory profiling')
+    parser.add_argument('--no-plots', action='store_true', help='Skip the plotting benchmarks')
+    args = parser.parse_args(argv)
+
+    report = _current_report(args)
+    current = summarize(report)
+    baseline_path = Path(args.baseline)
+
+    if args.command == 'record':
+        save_baseline(current, baseline_path, meta=report.get('meta'))
+        print(f"Recorded {len(current)} benchmarks to {baseline_path}")
+        return 0
+
+    baseline = load_baseline(baseline_path)['benchmarks']
+    rows = compare(baseline, current, threshold=args.threshold,
+                   memory_threshold=None if args.no_memory else args.memory_threshold)
+    print(format_comparison(rows))
+
+    missing = sorted(set(current) - set(baseline))
+    if missing:
+        print(f"No baseline for: {', '.join(missing)}")
+
+    regressions = [row['benchmark'] for row in rows if row['regression']]
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
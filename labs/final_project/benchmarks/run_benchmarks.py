@@ -0,0 +1,183 @@
+"""
+Benchmark suite for the LCA pipeline.
+
+Times and memory-profiles each pipeline stage on synthetic inventories of
+increasing size and writes the results to a JSON file.
+
+Usage:
+    python -m benchmarks.run_benchmarks --sizes 1k 100k --output results/benchmarks.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from src.calculations import LCACalculator
+from src.data_input import DataInput
+from src.synthetic_data import DATASET_SIZES, parse_size, write_dataset
+from src.visualization import LCAVisualizer
+
+
+def measure(func: Callable, *args, repeat: int = 1,
+            memory: bool = True) -> Tuple[object, List[float], Optional[int]]:
+    """
+    Time a call and optionally record its peak traced memory.
+
+    Timed runs are done without tracemalloc, which slows allocations down;
+    the memory figure comes from one extra traced run.
+
+    Args:
+        func: Function to benchmark
+        *args: Arguments passed to func
+        repeat: Number of timed runs
+        memory: Whether to measure peak memory
+
+    Returns:
+        Tuple of (result of the last run, wall times in seconds, peak bytes or None)
+    """
+    times = []
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return result, times, peak
+
+
+def _plot_all(visualizer: LCAVisualizer, impacts) -> None:
+    product_ids = list(impacts['product_id'].unique()[:5])
+    figures = [
+        visualizer.plot_impact_breakdown(impacts, 'carbon_impact', 'material_type'),
+        visualizer.plot_life_cycle_impacts(impacts, product_ids[0]),
+        visualizer.plot_product_comparison(impacts, product_ids),
+        visualizer.plot_end_of_life_breakdown(impacts, product_ids[0]),
+        visualizer.plot_impact_correlation(impacts)
+    ]
+    for fig in figures:
+        plt.close(fig)
+
+
+def benchmark_size(n_rows: int, data_dir: Path, repeat: int = 1, memory: bool = True,
+                   plots: bool = True, seed: int = 42) -> List[Dict]:
+    """
+    Benchmark every pipeline stage on an inventory of n_rows rows.
+
+    Args:
+        n_rows: Inventory size
+        data_dir: Directory holding (or receiving) the synthetic dataset
+        repeat: Number of timed runs per stage
+        memory: Whether to measure peak memory
+        plots: Whether to benchmark the plotting functions
+        seed: Random seed for the generated data
+
+    Returns:
+        List of result records, one per stage
+    """
+    data_path = data_dir / f'inventory_{n_rows}.csv'
+    factors_path = data_dir / 'impact_factors.json'
+    if not data_path.exists() or not factors_path.exists():
+        write_dataset(n_rows, data_dir, seed=seed)
+
+    data_input = DataInput()
+    calculator = LCACalculator(impact_factors_path=factors_path)
+    visualizer = LCAVisualizer()
+
+    records = []
+
+    def run(name, func, *args):
+        result, times, peak = measure(func, *args, repeat=repeat, memory=memory)
+        records.append({
+            'name': name,
+            'rows': n_rows,
+            'wall_s': times,
+            'peak_mem_bytes': peak
+        })
+        print(f"{name:<24} rows={n_rows:<10} best={min(times):.4f}s"
+              + (f" peak={peak / 2 ** 20:.1f}MiB" if peak is not None else ''))
+        return result
+
+    data = run('read_data', data_input.read_data, data_path)
+    run('validate_data', data_input.validate_data, data)
+    impacts = run('calculate_impacts', calculator.calculate_impacts, data)
+    run('calculate_total_impacts', calculator.calculate_total_impacts, impacts)
+    run('normalize_impacts', calculator.normalize_impacts, impacts)
+    if plots:
+        run('plots', _plot_all, visualizer, impacts)
+
+    return records
+
+
+def run_suite(sizes: List[str], data_dir: Path, repeat: int = 1, memory: bool = True,
+              plots: bool = True, seed: int = 42) -> Dict:
+    """
+    Run the benchmark suite for each requested dataset size.
+
+    Returns:
+        Dictionary with run metadata and a flat list of result records
+    """
+    results = []
+    for size in sizes:
+        n_rows = parse_size(size)
+        for record in benchmark_size(n_rows, data_dir, repeat=repeat, memory=memory,
+                                     plots=plots, seed=seed):
+            record['size'] = size
+            results.append(record)
+
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+            'repeat': repeat
+        },
+        'results': results
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the LCA pipeline.')
+    parser.add_argument('--sizes', nargs='+', default=['1k', '100k'],
+                        help=f"Dataset sizes ({', '.join(DATASET_SIZES)} or a row count)")
+    parser.add_argument('--data-dir', default='data/synthetic')
+    parser.add_argument('--output', default='results/benchmarks.json')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-memory', action='store_true', help='Skip memory profiling')
+    parser.add_argument('--no-plots', action='store_true', help='Skip the plotting benchmarks')
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.sizes, Path(args.data_dir), repeat=args.repeat,
+                       memory=not args.no_memory, plots=not args.no_plots, seed=args.seed)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == '__main__':
+    main()
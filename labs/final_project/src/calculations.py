@@ -3,6 +3,8 @@ import numpy as np
 from typing import Dict, List, Union
 from pathlib import Path
 
+from .profiling import instrument
+
 class LCACalculator:
     def __init__(self, impact_factors_path: Union[str, Path] = None):
         """
@@ -19,6 +21,7 @@ class LCACalculator:
         data_input = DataInput()
         return data_input.read_impact_factors(file_path)
     
+    @instrument
     def calculate_impacts(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate environmental impacts for each product and life cycle stage.
@@ -76,6 +79,7 @@ class LCACalculator:
             
         return pd.DataFrame(results)
     
+    @instrument
     def calculate_total_impacts(self, impacts: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate total impacts across all life cycle stages for each product.
@@ -96,6 +100,7 @@ class LCACalculator:
         
         return total_impacts
     
+    @instrument
     def normalize_impacts(self, impacts: pd.DataFrame) -> pd.DataFrame:
         """
         Normalize impacts to a common scale (0-1).
@@ -117,6 +122,7 @@ class LCACalculator:
                 
         return normalized
     
+    @instrument
     def compare_alternatives(self, impacts: pd.DataFrame, product_ids: List[str]) -> pd.DataFrame:
         """
         Compare environmental impacts between alternative products.
@@ -0,0 +1,173 @@
+"""
+Command line interface for LCA tool.
+Runs the full pipeline (read, validate, calculate, total, normalize, save and
+optionally plot) so that large runs can be launched and tuned without code.
+
+Example:
+    lca-tool data/raw/sample_data.csv --impact-factors data/raw/impact_factors.json \\
+        --output-dir results --workers 4 --chunk-size 100000 --plot --profile
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+from . import profiling
+from .calculations import LCACalculator
+from .data_input import DataInput
+from .utils import save_results
+
+OUTPUT_FORMATS = ['csv', 'xlsx', 'json']
+
+_worker_calculator: Optional[LCACalculator] = None
+
+
+def _init_worker(impact_factors: dict) -> None:
+    global _worker_calculator
+    _worker_calculator = LCACalculator()
+    _worker_calculator.impact_factors = impact_factors
+
+
+def _calculate_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    return _worker_calculator.calculate_impacts(chunk)
+
+
+def calculate_impacts_chunked(calculator: LCACalculator, data: pd.DataFrame,
+                              workers: int = 1, chunk_size: Optional[int] = None) -> pd.DataFrame:
+    """
+    Calculate impacts chunk by chunk, optionally in a process pool.
+
+    Args:
+        calculator: Calculator holding the impact factors
+        data: DataFrame containing product data
+        workers: Number of worker processes (1 runs in-process)
+        chunk_size: Rows per chunk (defaults to an even split over the workers)
+
+    Returns:
+        DataFrame with calculated impacts, in input order
+    """
+    if workers <= 1 and chunk_size is None:
+        return calculator.calculate_impacts(data)
+
+    if chunk_size is None:
+        chunk_size = -(-len(data) // workers)
+    chunk_size = max(1, chunk_size)
+    chunks = [data.iloc[start:start + chunk_size] for start in range(0, len(data), chunk_size)]
+    if not chunks:
+        return calculator.calculate_impacts(data)
+
+    if workers <= 1:
+        results = [calculator.calculate_impacts(chunk) for chunk in chunks]
+    else:
+        with profiling.stage('calculate_impacts (parallel)', rows=len(data)):
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(calculator.impact_factors,)) as executor:
+                results = list(executor.map(_calculate_chunk, chunks))
+
+    return pd.concat(results, ignore_index=True)
+
+
+def save_plots(impacts: pd.DataFrame, output_dir: Path) -> List[Path]:
+    """
+    Render the standard set of plots into output_dir as PNG files.
+
+    Returns:
+        Paths of the written images
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from .visualization import LCAVisualizer
+
+    visualizer = LCAVisualizer()
+    product_ids = list(impacts['product_id'].unique()[:5])
+    first = product_ids[0]
+    figures = {
+        'impact_breakdown.png': visualizer.plot_impact_breakdown(impacts, 'carbon_impact', 'material_type'),
+        f'life_cycle_impacts_{first}.png': visualizer.plot_life_cycle_impacts(impacts, first),
+        'product_comparison.png': visualizer.plot_product_comparison(impacts, product_ids),
+        f'end_of_life_{first}.png': visualizer.plot_end_of_life_breakdown(impacts, first),
+        'impact_correlation.png': visualizer.plot_impact_correlation(impacts)
+    }
+
+    paths = []
+    for name, fig in figures.items():
+        path = output_dir / name
+        with profiling.stage('savefig'):
+            fig.savefig(path, bbox_inches='tight')
+        plt.close(fig)
+        paths.append(path)
+    return paths
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='lca-tool', description='Run the LCA pipeline end to end.')
+    parser.add_argument('input', help='Product data file (.csv, .xlsx or .json)')
+    parser.add_argument('--impact-factors', required=True, help='Impact factors JSON file')
+    parser.add_argument('--output-dir', default='results', help='Directory for results')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='csv', help='Output file format')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes for impact calculation')
+    parser.add_argument('--chunk-size', type=int, default=None, help='Rows per calculation chunk')
+    parser.add_argument('--plot', action='store_true', help='Also save the standard plots')
+    parser.add_argument('--no-validate', action='store_true', help='Skip input validation')
+    parser.add_argument('--profile', action='store_true',
+                        help='Write per-stage profiling traces to the output directory')
+    return parser
+
+
+def run(args: argparse.Namespace) -> int:
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    data_input = DataInput()
+    data = data_input.read_data(args.input)
+    print(f"Read {len(data)} rows from {args.input}")
+
+    if not args.no_validate and not data_input.validate_data(data):
+        print("Validation failed; use --no-validate to run anyway.")
+        return 1
+
+    calculator = LCACalculator(impact_factors_path=args.impact_factors)
+    impacts = calculate_impacts_chunked(calculator, data, workers=args.workers,
+                                        chunk_size=args.chunk_size)
+    total_impacts = calculator.calculate_total_impacts(impacts)
+    normalized = calculator.normalize_impacts(total_impacts)
+
+    for name, frame in [('impact_results', impacts),
+                        ('total_impact_results', total_impacts),
+                        ('normalized_impact_results', normalized)]:
+        path = output_dir / f'{name}.{args.format}'
+        save_results(frame, path, format=args.format)
+        print(f"Saved {path}")
+
+    if args.plot:
+        for path in save_plots(impacts, output_dir):
+            print(f"Saved {path}")
+
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if not args.profile:
+        return run(args)
+
+    with profiling.profile() as profiler:
+        with profiling.stage('lca-tool'):
+            status = run(args)
+
+    output_dir = Path(args.output_dir)
+    profiler.export_json(output_dir / 'profile.json')
+    profiler.export_folded(output_dir / 'profile.folded')
+    print(profiler.summary().to_string())
+    print(f"Profiling traces written to {output_dir}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,6 +3,8 @@ import json
 from pathlib import Path
 from typing import Dict, List, Union
 
+from .profiling import instrument
+
 class DataInput:
     def __init__(self):
         self.supported_formats = ['.csv', '.xlsx', '.json']
@@ -14,6 +16,7 @@ class DataInput:
             'water_usage_liters'
         ]
 
+    @instrument
     def read_data(self, file_path: Union[str, Path]) -> pd.DataFrame:
         """
         Read data from various file formats.
@@ -32,6 +35,7 @@ class DataInput:
         elif file_path.suffix == '.json':
             return pd.read_json(file_path)
 
+    @instrument
     def validate_data(self, data: pd.DataFrame) -> bool:
         """
         Validate input data structure and content.
@@ -62,6 +66,7 @@ class DataInput:
 
         return True
 
+    @instrument
     def read_impact_factors(self, file_path: Union[str, Path]) -> Dict:
         """
         Read impact factors from JSON file.
@@ -0,0 +1,275 @@
+"""
+Profiling module for LCA tool.
+Records per-call wall time, CPU time, peak memory and row counts for the
+instrumented pipeline stages and exports them as JSON or flame-graph input.
+
+Profiling is off by default. Enable it for a block of code with::
+
+    with profile() as profiler:
+        run_pipeline()
+    profiler.export_json('trace.json')
+    profiler.export_folded('trace.folded')
+
+or for a whole process by setting the ``LCA_PROFILE`` environment variable
+(``LCA_PROFILE_DIR`` selects where the traces are written at exit).
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+import pandas as pd
+
+ENV_VAR = 'LCA_PROFILE'
+ENV_DIR_VAR = 'LCA_PROFILE_DIR'
+
+
+class _Frame:
+    __slots__ = ('name', 'path', 'start_wall', 'start_cpu', 'start_mem', 'peak', 'child_wall')
+
+    def __init__(self, name: str, path: str, start_mem: int):
+        self.name = name
+        self.path = path
+        self.start_mem = start_mem
+        self.peak = start_mem
+        self.child_wall = 0.0
+        self.start_cpu = time.process_time()
+        self.start_wall = time.perf_counter()
+
+
+class Profiler:
+    """
+    Collects one record per instrumented call.
+
+    Nested calls are tracked on a per-thread stack so that exclusive (self)
+    time can be derived for flame graphs.
+    """
+
+    def __init__(self, track_memory: bool = True):
+        self.track_memory = track_memory
+        self.records: List[Dict] = []
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _stack(self) -> List[_Frame]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _memory(self) -> int:
+        if not tracemalloc.is_tracing():
+            return 0
+        current, peak = tracemalloc.get_traced_memory()
+        stack = self._stack()
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def enter(self, name: str) -> _Frame:
+        stack = self._stack()
+        path = f'{stack[-1].path};{name}' if stack else name
+        frame = _Frame(name, path, self._memory())
+        stack.append(frame)
+        return frame
+
+    def exit(self, frame: _Frame, rows_in: Optional[int] = None,
+             rows_out: Optional[int] = None) -> None:
+        end_wall = time.perf_counter()
+        end_cpu = time.process_time()
+        self._memory()
+
+        stack = self._stack()
+        stack.pop()
+        wall = end_wall - frame.start_wall
+        if stack:
+            stack[-1].child_wall += wall
+            stack[-1].peak = max(stack[-1].peak, frame.peak)
+
+        self.records.append({
+            'name': frame.name,
+            'stack': frame.path,
+            'thread': threading.get_ident(),
+            'start_s': frame.start_wall - self._origin,
+            'wall_s': wall,
+            'self_wall_s': wall - frame.child_wall,
+            'cpu_s': end_cpu - frame.start_cpu,
+            'peak_mem_bytes': (frame.peak - frame.start_mem) if tracemalloc.is_tracing() else None,
+            'rows_in': rows_in,
+            'rows_out': rows_out
+        })
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Aggregate the records per stage.
+
+        Returns:
+            DataFrame with call counts and total/max timings per stage
+        """
+        records = pd.DataFrame(self.records, columns=[
+            'name', 'wall_s', 'cpu_s', 'peak_mem_bytes', 'rows_in'
+        ])
+        return records.groupby('name').agg(
+            calls=('wall_s', 'size'),
+            wall_s=('wall_s', 'sum'),
+            cpu_s=('cpu_s', 'sum'),
+            peak_mem_bytes=('peak_mem_bytes', 'max'),
+            rows_in=('rows_in', 'sum')
+        ).sort_values('wall_s', ascending=False)
+
+    def export_json(self, file_path: Union[str, Path]) -> None:
+        """
+        Write all records to a JSON file.
+        """
+        with open(file_path, 'w') as f:
+            json.dump({'records': self.records}, f, indent=2)
+
+    def export_folded(self, file_path: Union[str, Path]) -> None:
+        """
+        Write exclusive wall time in folded-stack format ("a;b;c <microseconds>"),
+        which flamegraph.pl, inferno and speedscope can load.
+        """
+        totals: Dict[str, int] = {}
+        for record in self.records:
+            totals[record['stack']] = (totals.get(record['stack'], 0)
+                                       + int(round(record['self_wall_s'] * 1e6)))
+        with open(file_path, 'w') as f:
+            for stack, micros in totals.items():
+                f.write(f'{stack} {micros}\n')
+
+    def export_chrome_trace(self, file_path: Union[str, Path]) -> None:
+        """
+        Write records in Chrome trace event format (chrome://tracing, Perfetto, speedscope).
+        """
+        events = [{
+            'name': record['name'],
+            'ph': 'X',
+            'ts': record['start_s'] * 1e6,
+            'dur': record['wall_s'] * 1e6,
+            'pid': os.getpid(),
+            'tid': record['thread'],
+            'args': {key: record[key] for key in ('cpu_s', 'peak_mem_bytes', 'rows_in', 'rows_out')}
+        } for record in self.records]
+        with open(file_path, 'w') as f:
+            json.dump({'traceEvents': events}, f)
+
+
+_active: Optional[Profiler] = None
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Return the active profiler, or None when profiling is disabled."""
+    return _active
+
+
+@contextmanager
+def profile(track_memory: bool = True):
+    """
+    Enable profiling for the duration of the block.
+
+    Args:
+        track_memory: Whether to trace peak memory (slows allocations down)
+
+    Yields:
+        The Profiler collecting the records
+    """
+    global _active
+    previous = _active
+    profiler = Profiler(track_memory=track_memory)
+    profiler.start()
+    _active = profiler
+    try:
+        yield profiler
+    finally:
+        _active = previous
+        profiler.stop()
+
+
+def _row_count(value) -> Optional[int]:
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return len(value)
+    return None
+
+
+def instrument(func: Callable) -> Callable:
+    """
+    Decorator recording a profiling record for each call of func.
+
+    When profiling is disabled the wrapper only does a global lookup before
+    calling through.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = _active
+        if profiler is None:
+            return func(*args, **kwargs)
+
+        rows_in = next((n for n in map(_row_count, args) if n is not None), None)
+        frame = profiler.enter(name)
+        result = None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        finally:
+            profiler.exit(frame, rows_in=rows_in, rows_out=_row_count(result))
+
+    return wrapper
+
+
+@contextmanager
+def stage(name: str, rows: Optional[int] = None):
+    """
+    Record an arbitrary block of code as a named stage.
+    """
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+
+    frame = profiler.enter(name)
+    try:
+        yield
+    finally:
+        profiler.exit(frame, rows_in=rows)
+
+
+def _enable_from_env() -> None:
+    global _active
+    if os.environ.get(ENV_VAR, '') in ('', '0'):
+        return
+
+    _active = Profiler()
+    _active.start()
+    output_dir = Path(os.environ.get(ENV_DIR_VAR, '.'))
+
+    def _export(profiler: Profiler = _active) -> None:
+        if profiler.records:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            profiler.export_json(output_dir / f'lca_profile_{os.getpid()}.json')
+            profiler.export_folded(output_dir / f'lca_profile_{os.getpid()}.folded')
+
+    atexit.register(_export)
+
+
+_enable_from_env()
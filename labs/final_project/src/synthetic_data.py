@@ -0,0 +1,210 @@
+"""
+Synthetic data module for LCA tool.
+Generates seeded, schema-valid product inventories and matching impact factors
+for testing and benchmarking at realistic sizes.
+"""
+
+import argparse
+import json
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple, Union
+from pathlib import Path
+
+# Named dataset sizes used by the benchmark suite
+DATASET_SIZES = {
+    '1k': 1_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+    '10m': 10_000_000
+}
+
+LIFE_CYCLE_STAGES = ['Manufacturing', 'Transportation', 'End-of-Life']
+
+TRANSPORT_MODES = ['Truck', 'Rail', 'Ship']
+
+# Material name -> (typical quantity in kg, carbon factor in kg CO2e/kg)
+MATERIALS = {
+    'Steel': (500, 1.8),
+    'Aluminum': (20, 2.5),
+    'Concrete': (2500, 0.14),
+    'Wood': (100, 0.8),
+    'Clay': (2.5, 1.4),
+    'Glass': (50, 6.0),
+    'Copper': (10, 20.0),
+    'Cement': (20, 0.9),
+    'Plastic': (5, 1.2),
+    'Paper': (5, 0.8)
+}
+
+# Stage multipliers applied to the manufacturing factors
+_STAGE_SCALES = {
+    'manufacturing': 1.0,
+    'transportation': 0.25,
+    'end-of-life': 0.1
+}
+
+_CHUNK_ROWS = 1_000_000
+
+
+def generate_impact_factors(materials: Optional[List[str]] = None) -> Dict:
+    """
+    Build an impact factor table matching the generated inventories.
+
+    Keys are the lower-cased material and life cycle stage names, which is
+    how LCACalculator looks them up.
+
+    Args:
+        materials: Material names to include (defaults to all known materials)
+
+    Returns:
+        Dictionary of impact factors
+    """
+    materials = materials or list(MATERIALS)
+    impact_factors = {}
+    for material in materials:
+        carbon = MATERIALS[material][1]
+        impact_factors[material.lower()] = {
+            stage: {
+                'carbon_impact': round(carbon * scale, 4),
+                'carbon_unit': 'kg CO2e',
+                'energy_impact': round(carbon * 10 * scale, 4),
+                'energy_unit': 'MJ',
+                'water_impact': round(carbon * 50 * scale, 4),
+                'water_unit': 'L'
+            }
+            for stage, scale in _STAGE_SCALES.items()
+        }
+    return impact_factors
+
+
+def generate_inventory(n_rows: int, seed: int = 42,
+                       first_product: int = 0) -> pd.DataFrame:
+    """
+    Generate a schema-valid product inventory.
+
+    Each product contributes one row per life cycle stage, so products span
+    three consecutive rows. End-of-life rates always sum to 1.
+
+    Args:
+        n_rows: Number of rows to generate
+        seed: Random seed
+        first_product: Index of the first product (used for chunked output)
+
+    Returns:
+        DataFrame with the columns required by DataInput
+    """
+    rng = np.random.default_rng(seed)
+    n_stages = len(LIFE_CYCLE_STAGES)
+    n_products = -(-n_rows // n_stages)
+
+    material_names = np.array(list(MATERIALS))
+    base_quantity = np.array([q for q, _ in MATERIALS.values()])
+    base_carbon = np.array([c for _, c in MATERIALS.values()])
+
+    # Per-product attributes, repeated for each stage
+    material_idx = rng.integers(0, len(material_names), n_products)
+    quantity = base_quantity[material_idx] * rng.uniform(0.5, 1.5, n_products)
+    rates = rng.dirichlet([2.0, 2.0, 1.0], n_products)
+    product_numbers = np.arange(first_product, first_product + n_products)
+
+    product_ids = pd.Series(product_numbers).astype(str).str.zfill(8)
+    product_id = ('P' + product_ids).to_numpy()
+    product_name = (pd.Series(material_names[material_idx]) + ' Product ' + product_ids).to_numpy()
+
+    def per_row(values):
+        return np.repeat(values, n_stages)[:n_rows]
+
+    material_idx = per_row(material_idx)
+    quantity = per_row(quantity)
+    stage_idx = np.tile(np.arange(n_stages), n_products)[:n_rows]
+    rates = np.repeat(rates, n_stages, axis=0)[:n_rows]
+    is_eol = stage_idx == n_stages - 1
+
+    energy = quantity * rng.uniform(0.05, 0.5, n_rows)
+    carbon = quantity * base_carbon[material_idx] * rng.uniform(0.1, 0.3, n_rows)
+
+    return pd.DataFrame({
+        'product_id': per_row(product_id),
+        'product_name': per_row(product_name),
+        'life_cycle_stage': np.array(LIFE_CYCLE_STAGES)[stage_idx],
+        'material_type': material_names[material_idx],
+        'quantity_kg': quantity.round(3),
+        'energy_consumption_kwh': energy.round(3),
+        'transport_distance_km': rng.uniform(10, 500, n_rows).round(1),
+        'transport_mode': np.array(TRANSPORT_MODES)[rng.integers(0, len(TRANSPORT_MODES), n_rows)],
+        'waste_generated_kg': np.where(is_eol, quantity, quantity * 0.05).round(3),
+        'recycling_rate': rates[:, 0],
+        'landfill_rate': rates[:, 1],
+        'incineration_rate': 1.0 - rates[:, 0] - rates[:, 1],
+        'carbon_footprint_kg_co2e': carbon.round(3),
+        'water_usage_liters': (energy * rng.uniform(0.1, 1.0, n_rows)).round(3)
+    })
+
+
+def write_dataset(n_rows: int, output_dir: Union[str, Path], seed: int = 42,
+                  chunk_rows: int = _CHUNK_ROWS) -> Tuple[Path, Path]:
+    """
+    Write an inventory CSV and its matching impact_factors.json.
+
+    Large inventories are generated and appended in chunks so memory use
+    stays bounded. The output only depends on n_rows, seed and chunk_rows.
+
+    Args:
+        n_rows: Number of inventory rows
+        output_dir: Directory to write into (created if missing)
+        seed: Random seed
+        chunk_rows: Rows generated per chunk
+
+    Returns:
+        Tuple of (inventory path, impact factors path)
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    data_path = output_dir / f'inventory_{n_rows}.csv'
+    factors_path = output_dir / 'impact_factors.json'
+
+    n_stages = len(LIFE_CYCLE_STAGES)
+    chunk_rows = max(n_stages, chunk_rows - chunk_rows % n_stages)
+    seeds = np.random.SeedSequence(seed).spawn(-(-n_rows // chunk_rows))
+
+    for i, chunk_seed in enumerate(seeds):
+        start = i * chunk_rows
+        chunk = generate_inventory(min(chunk_rows, n_rows - start), seed=chunk_seed,
+                                   first_product=start // n_stages)
+        chunk.to_csv(data_path, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+
+    with open(factors_path, 'w') as f:
+        json.dump(generate_impact_factors(), f, indent=4)
+
+    return data_path, factors_path
+
+
+def parse_size(size: str) -> int:
+    """
+    Convert a named size ('1k', '1m', ...) or a plain integer string to rows.
+    """
+    size = size.lower()
+    if size in DATASET_SIZES:
+        return DATASET_SIZES[size]
+    try:
+        return int(size)
+    except ValueError:
+        raise ValueError(f"Unknown dataset size: {size}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Generate synthetic LCA inventories.')
+    parser.add_argument('--sizes', nargs='+', default=['1k', '100k'],
+                        help=f"Dataset sizes ({', '.join(DATASET_SIZES)} or a row count)")
+    parser.add_argument('--output-dir', default='data/synthetic')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        data_path, factors_path = write_dataset(parse_size(size), args.output_dir, seed=args.seed)
+        print(f"Wrote {data_path} and {factors_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,8 @@ import pandas as pd
 from typing import Dict, List, Union
 from pathlib import Path
 
+from .profiling import instrument
+
 # Unit conversion factors
 UNIT_CONVERSIONS = {
     'kg': {
@@ -63,6 +65,7 @@ def convert_units(value: float, from_unit: str, to_unit: str) -> float:
     return value
 
 
+@instrument
 def save_results(data: pd.DataFrame, file_path: Union[str, Path],
                  format: str = 'csv') -> None:
     """
@@ -9,6 +9,8 @@ import seaborn as sns
 from typing import List, Optional, Dict
 import numpy as np
 
+from .profiling import instrument
+
 
 class LCAVisualizer:
     def __init__(self):
@@ -21,6 +23,7 @@ class LCAVisualizer:
             'waste_generated_kg': 'Waste Generated (kg)'
         }
 
+    @instrument
     def plot_impact_breakdown(self, data: pd.DataFrame, impact_type: str,
                               group_by: str = 'material_type',
                               title: Optional[str] = None) -> plt.Figure:
@@ -49,6 +52,7 @@ class LCAVisualizer:
 
         return fig
 
+    @instrument
     def plot_life_cycle_impacts(self, data: pd.DataFrame,
                                 product_id: str) -> plt.Figure:
         """
@@ -83,6 +87,7 @@ class LCAVisualizer:
         plt.tight_layout()
         return fig
 
+    @instrument
     def plot_product_comparison(self, data: pd.DataFrame,
                                 product_ids: List[str]) -> plt.Figure:
         """
@@ -132,6 +137,7 @@ class LCAVisualizer:
 
         return fig
 
+    @instrument
     def plot_end_of_life_breakdown(self, data: pd.DataFrame,
                                    product_id: str) -> plt.Figure:
         """
@@ -160,6 +166,7 @@ class LCAVisualizer:
 
         return fig
 
+    @instrument
     def plot_impact_correlation(self, data: pd.DataFrame) -> plt.Figure:
         """
         Create a correlation heatmap of different impact categories.
@@ -0,0 +1,54 @@
+import pytest
+import json
+from benchmarks.baseline import compare, load_baseline, main, save_baseline, summarize
+
+
+def make_report(times, peak=1000):
+    return {'results': [{
+        'name': 'calculate_impacts', 'size': '1k', 'rows': 1000,
+        'wall_s': times, 'peak_mem_bytes': peak
+    }]}
+
+def test_summarize_uses_median_and_iqr():
+    """Test median/IQR statistics."""
+    stats = summarize(make_report([1.0, 2.0, 3.0, 4.0, 100.0]))['calculate_impacts@1k']
+    assert stats['median_s'] == 3.0
+    assert stats['iqr_s'] == 2.0
+    assert stats['runs'] == 5
+
+def test_compare_flags_slowdowns_beyond_noise():
+    """Test that only slowdowns above threshold and noise are flagged."""
+    baseline = summarize(make_report([1.0, 1.0, 1.0]))
+    assert not compare(baseline, summarize(make_report([1.05, 1.05, 1.05])))[0]['regression']
+    assert compare(baseline, summarize(make_report([1.5, 1.5, 1.5])))[0]['regression']
+    # Large spread in the current run hides the difference
+    assert not compare(baseline, summarize(make_report([0.5, 1.5, 3.0])))[0]['regression']
+    # Memory growth alone is a regression unless memory is ignored
+    grown = summarize(make_report([1.0, 1.0, 1.0], peak=2000))
+    assert compare(baseline, grown)[0]['regression']
+    assert not compare(baseline, grown, memory_threshold=None)[0]['regression']
+
+def test_baseline_file_roundtrip(tmp_path):
+    """Test recording and comparing through the command line."""
+    results = tmp_path / 'results.json'
+    baseline = tmp_path / 'baselines.json'
+    with open(results, 'w') as f:
+        json.dump(make_report([1.0, 1.1, 0.9]), f)
+
+    assert main(['record', '--results', str(results), '--baseline', str(baseline)]) == 0
+    assert load_baseline(baseline)['benchmarks']['calculate_impacts@1k']['median_s'] == 1.0
+    assert main(['compare', '--results', str(results), '--baseline', str(baseline)]) == 0
+
+    with open(results, 'w') as f:
+        json.dump(make_report([2.0, 2.1, 1.9]), f)
+    assert main(['compare', '--results', str(results), '--baseline', str(baseline)]) == 1
+
+def test_load_baseline_checks_version(tmp_path):
+    """Test that unknown schema versions are rejected."""
+    path = tmp_path / 'baselines.json'
+    save_baseline({}, path)
+    data = json.loads(path.read_text())
+    data['schema_version'] = 99
+    path.write_text(json.dumps(data))
+    with pytest.raises(ValueError):
+        load_baseline(path)
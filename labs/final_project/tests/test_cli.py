@@ -0,0 +1,46 @@
+import pytest
+import pandas as pd
+from src.calculations import LCACalculator
+from src.cli import calculate_impacts_chunked, main
+from src.synthetic_data import generate_inventory, write_dataset
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    return write_dataset(60, tmp_path / 'data', seed=11)
+
+def test_chunked_matches_serial(dataset):
+    """Test that chunked and parallel calculation match the single call."""
+    data_path, factors_path = dataset
+    data = pd.read_csv(data_path)
+    calculator = LCACalculator(impact_factors_path=factors_path)
+    expected = calculator.calculate_impacts(data)
+
+    pd.testing.assert_frame_equal(calculate_impacts_chunked(calculator, data, chunk_size=7), expected)
+    pd.testing.assert_frame_equal(calculate_impacts_chunked(calculator, data, workers=2), expected)
+
+def test_main_runs_pipeline(dataset, tmp_path):
+    """Test the end-to-end run with profiling enabled."""
+    data_path, factors_path = dataset
+    output_dir = tmp_path / 'out'
+
+    status = main([str(data_path), '--impact-factors', str(factors_path),
+                   '--output-dir', str(output_dir), '--format', 'json',
+                   '--chunk-size', '25', '--profile'])
+
+    assert status == 0
+    totals = pd.read_json(output_dir / 'total_impact_results.json')
+    assert len(totals) == 20
+    assert (output_dir / 'normalized_impact_results.json').exists()
+    assert 'LCACalculator.calculate_impacts' in (output_dir / 'profile.folded').read_text()
+
+def test_main_rejects_invalid_data(dataset, tmp_path):
+    """Test that invalid input stops the run."""
+    _, factors_path = dataset
+    data = generate_inventory(6)
+    data.loc[0, 'recycling_rate'] = 0.5
+    data_path = tmp_path / 'invalid.csv'
+    data.to_csv(data_path, index=False)
+
+    assert main([str(data_path), '--impact-factors', str(factors_path),
+                 '--output-dir', str(tmp_path / 'out')]) == 1
@@ -0,0 +1,63 @@
+import pytest
+import json
+from src import profiling
+from src.calculations import LCACalculator
+from src.data_input import DataInput
+from src.synthetic_data import write_dataset
+from src.utils import save_results
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    return write_dataset(30, tmp_path / 'data', seed=5)
+
+def test_disabled_by_default(dataset):
+    """Test that nothing is recorded outside a profiling block."""
+    data_path, _ = dataset
+    assert profiling.get_profiler() is None
+    DataInput().read_data(data_path)
+    assert profiling.get_profiler() is None
+
+def test_profile_records_stages(dataset, tmp_path):
+    """Test that each instrumented call produces a record."""
+    data_path, factors_path = dataset
+
+    with profiling.profile() as profiler:
+        data_input = DataInput()
+        data = data_input.read_data(data_path)
+        data_input.validate_data(data)
+        calculator = LCACalculator(impact_factors_path=factors_path)
+        impacts = calculator.calculate_impacts(data)
+        totals = calculator.calculate_total_impacts(impacts)
+        save_results(totals, tmp_path / 'totals.csv')
+
+    names = [record['name'] for record in profiler.records]
+    assert names == [
+        'DataInput.read_data', 'DataInput.validate_data', 'DataInput.read_impact_factors',
+        'LCACalculator.calculate_impacts', 'LCACalculator.calculate_total_impacts', 'save_results'
+    ]
+    calc = profiler.records[3]
+    assert calc['rows_in'] == 30 and calc['rows_out'] == 30
+    assert calc['wall_s'] >= calc['self_wall_s'] >= 0
+    assert calc['peak_mem_bytes'] > 0
+    assert profiler.records[4]['rows_out'] == 10
+    assert profiling.get_profiler() is None
+
+def test_nested_stages_and_exports(dataset, tmp_path):
+    """Test nested stacks and the JSON/folded exports."""
+    data_path, _ = dataset
+
+    with profiling.profile(track_memory=False) as profiler:
+        with profiling.stage('pipeline'):
+            DataInput().read_data(data_path)
+
+    assert profiler.records[0]['stack'] == 'pipeline;DataInput.read_data'
+    assert profiler.records[0]['peak_mem_bytes'] is None
+
+    profiler.export_json(tmp_path / 'trace.json')
+    profiler.export_folded(tmp_path / 'trace.folded')
+    with open(tmp_path / 'trace.json') as f:
+        assert len(json.load(f)['records']) == 2
+    lines = (tmp_path / 'trace.folded').read_text().splitlines()
+    assert {line.rsplit(' ', 1)[0] for line in lines} == {'pipeline', 'pipeline;DataInput.read_data'}
+    assert list(profiler.summary().index) == ['pipeline', 'DataInput.read_data']
@@ -0,0 +1,44 @@
+import pytest
+import pandas as pd
+import json
+from src.data_input import DataInput
+from src.calculations import LCACalculator
+from src.synthetic_data import generate_inventory, parse_size, write_dataset
+
+
+def test_generate_inventory_is_valid():
+    """Test that generated inventories pass validation."""
+    data = generate_inventory(300, seed=1)
+    data_input = DataInput()
+
+    assert len(data) == 300
+    assert list(data.columns) == data_input.required_columns
+    assert data_input.validate_data(data)
+
+def test_generate_inventory_is_seeded():
+    """Test that the same seed gives the same data."""
+    pd.testing.assert_frame_equal(generate_inventory(50, seed=7), generate_inventory(50, seed=7))
+    assert not generate_inventory(50, seed=7).equals(generate_inventory(50, seed=8))
+
+def test_write_dataset_matches_factors(tmp_path):
+    """Test that every material/stage pair has an impact factor."""
+    data_path, factors_path = write_dataset(100, tmp_path, seed=3, chunk_rows=30)
+    data = DataInput().read_data(data_path)
+    with open(factors_path) as f:
+        factors = json.load(f)
+
+    assert len(data) == 100
+    assert data['product_id'].nunique() == 34
+    for material, stage in zip(data['material_type'], data['life_cycle_stage']):
+        assert stage.lower() in factors[material.lower()]
+
+    impacts = LCACalculator(impact_factors_path=factors_path).calculate_impacts(data)
+    assert (impacts['carbon_impact'] > data['carbon_footprint_kg_co2e'].values).all()
+
+def test_parse_size():
+    """Test named and numeric dataset sizes."""
+    assert parse_size('1k') == 1_000
+    assert parse_size('10M') == 10_000_000
+    assert parse_size('250') == 250
+    with pytest.raises(ValueError):
+        parse_size('huge')
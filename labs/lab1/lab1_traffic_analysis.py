@@ -1,7 +1,11 @@
 # lab1_traffic_analysis.py
 
+import sys
+
 import pandas as pd
 
+from traffic_stream import analyze_files, summarize
+
 def main():
     # Load the traffic dataset
     try:
@@ -21,5 +25,19 @@ def main():
     print(f"Maximum vehicle count: {max_value}")
     print(f"Mean vehicle count: {mean_value:.2f}")
 
+def main_streaming(chunksize=1_000_000):
+    # Same statistics (plus median and std) per lane, in one pass over a chunked CSV
+    try:
+        lanes = analyze_files('../../datasets/traffic_data.csv', chunksize=chunksize)
+    except FileNotFoundError:
+        print("Error: The dataset file was not found. Please ensure 'traffic_data.csv' is located in the /datasets/ folder.")
+        return
+
+    print("Streaming Traffic Data Analysis:")
+    print(summarize(lanes).round(2))
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    if '--stream' in sys.argv:
+        main_streaming()
+    else:
+        main()
\ No newline at end of file
@@ -0,0 +1,191 @@
+# traffic_cube.py
+#
+# Pre-aggregated lane x date x hour cube for traffic counts. The cube is built
+# once from the raw CSVs (and extended as new days arrive), after which range
+# queries such as "mean vehicle count for Lane 2 at 07:00 over the last 30
+# days" only touch a few small arrays instead of rescanning the CSV.
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+HOURS = 24
+
+
+class TrafficCube:
+    """
+    Sum, count, min and max of vehicle counts per lane, date and hour of day.
+    """
+
+    def __init__(self, lanes=(), start_date=None, n_days=0):
+        self.lanes = list(lanes)
+        self.start_date = None if start_date is None else np.datetime64(start_date, "D")
+        shape = (len(self.lanes), n_days, HOURS)
+        self.sum = np.zeros(shape)
+        self.count = np.zeros(shape, dtype=np.int64)
+        self.min = np.full(shape, np.inf)
+        self.max = np.full(shape, -np.inf)
+
+    @property
+    def n_days(self):
+        return self.sum.shape[1]
+
+    @property
+    def dates(self):
+        if self.start_date is None:
+            return np.array([], dtype="datetime64[D]")
+        return self.start_date + np.arange(self.n_days)
+
+    def _grow(self, lanes, first_day, last_day):
+        """Extend the lane and date axes so they cover the given lanes and days."""
+        new_lanes = [lane for lane in lanes if lane not in self.lanes]
+        if self.start_date is None:
+            start, end, offset = first_day, last_day, 0
+        else:
+            start = min(self.start_date, first_day)
+            end = max(self.start_date + self.n_days - 1, last_day)
+            offset = int((self.start_date - start).astype(int))
+        n_days = int((end - start).astype(int)) + 1
+
+        if not new_lanes and offset == 0 and n_days == self.n_days:
+            return
+        shape = (len(self.lanes) + len(new_lanes), n_days, HOURS)
+        for name, fill in (("sum", 0.0), ("count", 0), ("min", np.inf), ("max", -np.inf)):
+            old = getattr(self, name)
+            grown = np.full(shape, fill, dtype=old.dtype)
+            grown[:old.shape[0], offset:offset + old.shape[1]] = old
+            setattr(self, name, grown)
+        self.lanes.extend(new_lanes)
+        self.start_date = start
+
+    def add(self, df, time_col="timestamp", lane_col="lane", value_col="vehicle_count"):
+        """
+        Fold raw rows into the cube (new lanes and days extend the axes).
+        """
+        df = df.dropna(subset=[value_col])
+        if df.empty:
+            return self
+        times = pd.to_datetime(df[time_col]).to_numpy()
+        days = times.astype("datetime64[D]")
+        hours = (times.astype("datetime64[h]") - days).astype(np.int64)
+        values = df[value_col].to_numpy(dtype=float)
+
+        self._grow(pd.unique(df[lane_col]), days.min(), days.max())
+        lane_index = {lane: i for i, lane in enumerate(self.lanes)}
+        lane_codes = df[lane_col].map(lane_index).to_numpy()
+        day_codes = (days - self.start_date).astype(np.int64)
+
+        flat = np.ravel_multi_index((lane_codes, day_codes, hours), self.sum.shape)
+        # ufunc.at keeps the cost proportional to the new rows, not the cube size
+        np.add.at(self.sum.reshape(-1), flat, values)
+        np.add.at(self.count.reshape(-1), flat, 1)
+        np.minimum.at(self.min.reshape(-1), flat, values)
+        np.maximum.at(self.max.reshape(-1), flat, values)
+        return self
+
+    def add_csv(self, path, chunksize=1_000_000):
+        """
+        Append a traffic CSV (e.g. the newest day) to the cube, reading it in chunks.
+        """
+        for chunk in pd.read_csv(path, chunksize=chunksize):
+            self.add(chunk)
+        return self
+
+    @classmethod
+    def from_csv(cls, paths, chunksize=1_000_000):
+        cube = cls()
+        for path in ([paths] if isinstance(paths, str) else paths):
+            cube.add_csv(path, chunksize)
+        return cube
+
+    def _day_slice(self, start=None, end=None, last_days=None):
+        if last_days is not None:
+            return slice(max(0, self.n_days - last_days), self.n_days)
+        first = 0 if start is None else int((np.datetime64(start, "D") - self.start_date).astype(int))
+        last = self.n_days if end is None else int((np.datetime64(end, "D") - self.start_date).astype(int)) + 1
+        return slice(max(0, first), max(0, min(self.n_days, last)))
+
+    def query(self, lane=None, hour=None, start=None, end=None, last_days=None, stat="mean"):
+        """
+        Aggregate a statistic over a lane / hour / date range.
+
+        Args:
+            lane: Lane name or list of lanes (None for all lanes)
+            hour: Hour of day, list of hours or None for all hours
+            start, end: Inclusive date bounds (ignored when last_days is given)
+            last_days: Restrict to the most recent N days in the cube
+            stat: 'mean', 'sum', 'count', 'min' or 'max'
+        """
+        if lane is None:
+            lanes = slice(None)
+        else:
+            names = [lane] if isinstance(lane, str) else lane
+            lanes = [self.lanes.index(name) for name in names]
+        hours = slice(None) if hour is None else np.atleast_1d(hour)
+        days = self._day_slice(start, end, last_days)
+
+        def select(array):
+            return array[lanes][:, days][:, :, hours]
+
+        if stat == "mean":
+            count = select(self.count).sum()
+            return select(self.sum).sum() / count if count else np.nan
+        if stat == "sum":
+            return select(self.sum).sum()
+        if stat == "count":
+            return int(select(self.count).sum())
+        if stat == "min":
+            value = select(self.min).min(initial=np.inf)
+            return value if np.isfinite(value) else np.nan
+        if stat == "max":
+            value = select(self.max).max(initial=-np.inf)
+            return value if np.isfinite(value) else np.nan
+        raise ValueError(f"Unknown statistic: {stat}")
+
+    def save(self, path):
+        np.savez(path, lanes=np.array(self.lanes, dtype=str),
+                 start_date=np.array([self.start_date], dtype="datetime64[D]"),
+                 sum=self.sum, count=self.count, min=self.min, max=self.max)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            cube = cls()
+            cube.lanes = data["lanes"].tolist()
+            cube.start_date = data["start_date"][0]
+            cube.sum, cube.count = data["sum"], data["count"]
+            cube.min, cube.max = data["min"], data["max"]
+        return cube
+
+
+def main():
+    # Usage: python traffic_cube.py [traffic.csv ...] [--cube traffic_cube.npz]
+    # With --cube, the listed CSVs are appended to the saved cube (pass only new days).
+    args = sys.argv[1:]
+    cube_path = None
+    if "--cube" in args:
+        i = args.index("--cube")
+        cube_path = args[i + 1]
+        args = args[:i] + args[i + 2:]
+    paths = args or ["../../datasets/traffic_data.csv"]
+
+    try:
+        cube = TrafficCube.load(cube_path) if cube_path and os.path.exists(cube_path) else TrafficCube()
+        for path in paths:
+            cube.add_csv(path)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return
+    if cube_path:
+        cube.save(cube_path)
+
+    print(f"Cube: {len(cube.lanes)} lanes x {cube.n_days} days x {HOURS} hours")
+    for lane in cube.lanes:
+        print(f"{lane} mean at 07:00, last 30 days: {cube.query(lane, hour=7, last_days=30):.2f}")
+    print(f"Overall max vehicle count: {cube.query(stat='max'):.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# traffic_stream.py
+#
+# Streaming per-lane statistics for traffic sensor logs that do not fit in
+# memory. CSVs are read in chunks and every lane keeps a mergeable
+# StreamingStats (labs/common/streaming_stats.py), so results from several
+# chunks, files or worker processes can be combined; count, min, max, mean
+# and std are exact, the median is approximate.
+
+import glob
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+
+def _streaming_stats():
+    # StreamingStats lives in labs/common, shared with lab2. The labs folder is
+    # put on the path when the streaming code runs, not when this module is imported.
+    labs_dir = str(Path(__file__).resolve().parents[1])
+    if labs_dir not in sys.path:
+        sys.path.append(labs_dir)
+    from common.streaming_stats import StreamingStats
+    return StreamingStats
+
+
+def accumulate_chunk(df, value_col="vehicle_count", key_col="lane", rank_error=0.01):
+    """
+    Build one StreamingStats (count, min, max, mean, variance, median sketch)
+    per lane from a DataFrame chunk.
+    """
+    StreamingStats = _streaming_stats()
+    df = df[[key_col, value_col]].dropna(subset=[value_col])
+    return {lane: StreamingStats(rank_error).update(values.to_numpy())
+            for lane, values in df.groupby(key_col)[value_col]}
+
+
+def merge_all(results, rank_error=0.01):
+    """
+    Merge several {lane: StreamingStats} mappings into a new one.
+    """
+    StreamingStats = _streaming_stats()
+    merged = {}
+    for result in results:
+        for lane, stats in result.items():
+            merged.setdefault(lane, StreamingStats(rank_error)).merge(stats)
+    return merged
+
+
+def analyze_file(path, chunksize=1_000_000, value_col="vehicle_count", key_col="lane"):
+    """
+    Stream one CSV in chunks and return per-lane StreamingStats.
+    """
+    merged = {}
+    for chunk in pd.read_csv(path, usecols=[key_col, value_col], chunksize=chunksize):
+        merged = merge_all([merged, accumulate_chunk(chunk, value_col, key_col)])
+    return merged
+
+
+def analyze_files(pattern_or_paths, chunksize=1_000_000, max_workers=None):
+    """
+    Analyze many CSV files in parallel, one worker per file, and merge the results.
+    """
+    if isinstance(pattern_or_paths, str):
+        paths = sorted(glob.glob(pattern_or_paths))
+    else:
+        paths = list(pattern_or_paths)
+    if not paths:
+        raise FileNotFoundError(f"No traffic files found for {pattern_or_paths}")
+
+    _streaming_stats()  # results from the workers are unpickled here
+    if max_workers == 1 or len(paths) == 1:
+        results = [analyze_file(p, chunksize) for p in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(analyze_file, paths, [chunksize] * len(paths)))
+    return merge_all(results)
+
+
+def _row(stats):
+    return {"count": stats.count, "min": stats.min, "max": stats.max, "mean": stats.mean,
+            "median": float(stats.quantile(0.5)), "std": stats.std()}
+
+
+def summarize(accumulators):
+    """
+    Per-lane table plus an "All lanes" row merged from every lane.
+    """
+    overall = merge_all([{"All lanes": stats} for stats in accumulators.values()])
+    rows = {lane: _row(stats) for lane, stats in sorted(accumulators.items())}
+    rows.update({lane: _row(stats) for lane, stats in overall.items()})
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def main():
+    try:
+        accumulators = analyze_files("../../datasets/traffic_data.csv", chunksize=16)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return
+
+    print("Streaming Traffic Data Analysis:")
+    print(summarize(accumulators).round(2))
+
+
+if __name__ == "__main__":
+    main()
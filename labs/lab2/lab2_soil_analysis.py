@@ -1,3 +1,6 @@
+import sys
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 
@@ -14,6 +17,65 @@ def load_data(file_path):
         print(f"Error: The file {file_path} was not found.")
         return None
 
+def robust_clean(df, columns=None, outlier_columns=None, method="sigma", threshold=3.0, inplace=True):
+    """
+    Impute and flag outliers for many numeric columns in one vectorized pass.
+
+    Missing values in `columns` (default: all numeric columns) are filled with
+    the column mean. A row is kept when every column in `outlier_columns`
+    (default: the same as `columns`) is within `threshold` scale units of its
+    center: mean/std for method="sigma", median/scaled MAD for method="mad".
+    Where the MAD is zero (more than half the values are equal) the scaled
+    mean absolute deviation from the median is used instead.
+    Non-numeric columns are left untouched.
+
+    Returns (df, keep_mask, report): the imputed frame (the same object when
+    inplace=True), a boolean NumPy mask of rows to keep and a per-column table
+    of filled values, outliers, center and scale. Use df[keep_mask] to filter.
+    """
+    if method not in ("sigma", "mad"):
+        raise ValueError(f"Unknown outlier method: {method}")
+    if columns is None:
+        columns = df.select_dtypes(include="number").columns
+    columns = list(columns)
+    outlier_columns = columns if outlier_columns is None else list(outlier_columns)
+    all_columns = list(dict.fromkeys(columns + outlier_columns))
+    if not inplace:
+        df = df.copy()
+
+    values = df[all_columns].to_numpy(dtype=float)
+    missing = np.isnan(values)
+    means = np.nanmean(values, axis=0)
+    values = np.where(missing, means, values)
+
+    tested = np.isin(all_columns, outlier_columns)
+    checked = values[:, tested]
+    if method == "sigma":
+        center = checked.mean(axis=0)
+        scale = checked.std(axis=0, ddof=1)
+    else:
+        center = np.median(checked, axis=0)
+        deviation = np.abs(checked - center)
+        scale = 1.4826 * np.median(deviation, axis=0)
+        scale = np.where(scale == 0, 1.2533 * deviation.mean(axis=0), scale)
+
+    outside = np.zeros(values.shape, dtype=bool)
+    outside[:, tested] = np.abs(checked - center) > threshold * scale
+    keep_mask = ~outside.any(axis=1)
+
+    # Write back only the imputed columns that had gaps, so integer columns keep their dtype
+    filled = missing.any(axis=0) & np.isin(all_columns, columns)
+    if filled.any():
+        df[[c for c, f in zip(all_columns, filled) if f]] = values[:, filled]
+    report = pd.DataFrame({
+        "missing_filled": np.where(np.isin(all_columns, columns), missing.sum(axis=0), 0),
+        "outliers": outside.sum(axis=0),
+        "center": pd.Series(center, index=outlier_columns),
+        "scale": pd.Series(scale, index=outlier_columns),
+    }, index=all_columns)
+    return df, keep_mask, report
+
+
 def clean_data(df):
     """
     Clean the dataset by handling missing values and optionally removing outliers.
@@ -21,15 +83,16 @@ def clean_data(df):
     if df is None:
         return None
 
-    # Fill missing values with column mean
-    df.fillna(df.mean(), inplace=True)
+    # Fill missing values in every numeric column with its mean and flag
+    # soil_ph outliers in the same pass
+    outlier_columns = ['soil_ph'] if 'soil_ph' in df.columns else []
+    df, keep_mask, _ = robust_clean(df, columns=df.select_dtypes(include="number").columns,
+                                    outlier_columns=outlier_columns)
     print("Missing values handled.")
 
     # Optional: Remove outliers for soil_ph
-    if 'soil_ph' in df.columns:
-        mean_ph = df['soil_ph'].mean()
-        std_ph = df['soil_ph'].std()
-        df = df[np.abs(df['soil_ph'] - mean_ph) <= (3 * std_ph)]
+    if outlier_columns:
+        df = df[keep_mask]
         print("Outliers removed from soil_ph column.")
 
     return df
@@ -54,6 +117,31 @@ def compute_statistics(df, column):
     for key, value in stats.items():
         print(f"{key}: {value:.2f}")
 
+def compute_statistics_streaming(file_path, column, chunksize=1_000_000, rank_error=0.01):
+    """
+    Compute and print descriptive statistics for a column in one pass over a
+    chunked CSV. The median is approximate (KLL sketch, see common/streaming_stats.py).
+    """
+    # labs/common is put on the path here rather than at import time
+    labs_dir = str(Path(__file__).resolve().parents[1])
+    if labs_dir not in sys.path:
+        sys.path.append(labs_dir)
+    from common.streaming_stats import describe_csv
+
+    try:
+        stats = describe_csv(file_path, column, chunksize=chunksize, rank_error=rank_error)
+    except FileNotFoundError:
+        print(f"Error: The file {file_path} was not found.")
+        return None
+    except ValueError:
+        print(f"Error: Column '{column}' not found in the dataset.")
+        return None
+
+    print("\nStreaming Descriptive Statistics for", column)
+    for key, value in stats.summary(percentiles=(0.5,)).items():
+        print(f"{key}: {value:.2f}")
+    return stats
+
 def main():
     """
     Main function to run the analysis.
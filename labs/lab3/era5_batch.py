@@ -0,0 +1,117 @@
+import glob
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from era5_cache import load_era5_cached
+from era5_calendar import aggregate_calendar
+
+# Season codes used throughout lab3: month % 12 // 3 + 1
+SEASONS = {1: "Winter", 2: "Spring", 3: "Summer", 4: "Fall"}
+
+
+# Expand a glob pattern, a single path or a list of paths/patterns into a sorted file list
+def resolve_paths(sources):
+    if isinstance(sources, (str, Path)):
+        sources = [sources]
+    paths = []
+    for source in sources:
+        matches = glob.glob(str(source))
+        paths.extend(matches if matches else [str(source)])
+    return sorted(set(paths))
+
+
+# Site key from an ERA5 extract name, e.g. "berlin_era5_wind_20241231_20241231.csv" -> "berlin"
+def site_name(path):
+    name = Path(path).name
+    return name.split("_era5")[0] if "_era5" in name else Path(path).stem
+
+
+def load_site(path, site=None, cache_dir=None):
+    if cache_dir is not None:
+        df = load_era5_cached(path, cache_dir)
+    else:
+        df = pd.read_csv(path, parse_dates=["timestamp"])
+    df["site"] = site or site_name(path)
+    return df
+
+
+# Load many site CSVs in parallel and stack them into one frame with a categorical "site" key.
+# Threads are enough for the C CSV parser; use processes for very large files.
+# Pass cache_dir to reuse parsed series from the binary cache in era5_cache.py.
+def load_sites(sources, max_workers=None, use_processes=False, cache_dir=None):
+    paths = resolve_paths(sources)
+    if not paths:
+        raise FileNotFoundError(f"No ERA5 files found for {sources}")
+
+    executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_cls(max_workers=max_workers) as executor:
+        frames = list(executor.map(partial(load_site, cache_dir=cache_dir), paths))
+
+    combined = pd.concat(frames, ignore_index=True)
+    # Several files (e.g. one per year) can belong to the same site
+    sites = list(dict.fromkeys(site_name(p) for p in paths))
+    combined["site"] = pd.Categorical(combined["site"], categories=sites)
+    return combined
+
+
+# Vectorized wind speed and meteorological direction (degrees the wind blows FROM,
+# 0 = north, 90 = east). Returns a new frame; the input is left untouched.
+def add_wind_fields(df):
+    u = df["u10m"].to_numpy()
+    v = df["v10m"].to_numpy()
+    return df.assign(
+        wind_speed=np.hypot(u, v),
+        wind_direction=np.mod(180.0 + np.degrees(np.arctan2(u, v)), 360.0),
+    )
+
+
+# Wind speed sum and count per (site, month) in one grouped pass. The result is
+# additive, so partial sums from separate chunks or files can be combined with
+# merge_monthly_sums before computing means.
+def monthly_sums(df):
+    table = aggregate_calendar(df["timestamp"].to_numpy(), df["wind_speed"].to_numpy(),
+                               keys=("month",), groups=df["site"])
+    return table[["sum", "count"]]
+
+
+def merge_monthly_sums(partials):
+    return pd.concat(partials).groupby(level=["site", "month"], observed=True).sum()
+
+
+# Monthly and seasonal means from (site, month) sums; seasons are rolled up
+# from the monthly sums so the raw data never has to be scanned again.
+def finalize_aggregations(sums):
+    monthly_avg = (sums["sum"] / sums["count"]).unstack("month")
+
+    season = sums.index.get_level_values("month") % 12 // 3 + 1
+    seasonal = sums.groupby([sums.index.get_level_values("site"), season]).sum()
+    seasonal.index.names = ["site", "season"]
+    seasonal_avg = (seasonal["sum"] / seasonal["count"]).unstack("season")
+    return monthly_avg, seasonal_avg
+
+
+# Monthly and seasonal mean wind speed for all sites from one grouped pass
+def compute_site_aggregations(df):
+    return finalize_aggregations(monthly_sums(df))
+
+
+# Full batch run: load every site, add wind fields and aggregate
+def analyze_sites(sources, max_workers=None, use_processes=False, cache_dir=None):
+    combined = add_wind_fields(load_sites(sources, max_workers, use_processes, cache_dir))
+    monthly_avg, seasonal_avg = compute_site_aggregations(combined)
+    return combined, monthly_avg, seasonal_avg
+
+
+def main():
+    combined, monthly_avg, seasonal_avg = analyze_sites("../../datasets/*_era5_wind_*.csv")
+    print(f"Loaded {len(combined)} rows for {combined['site'].nunique()} sites.")
+    print("\nMonthly averages:\n", monthly_avg.round(2))
+    print("\nSeasonal averages:\n", seasonal_avg.rename(columns=SEASONS).round(2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".era5_cache"
+CACHE_VERSION = 2
+
+
+# SHA-256 of the source file, read in 1 MiB blocks
+def file_hash(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _entry_dir(cache_dir, key):
+    return Path(cache_dir) / f"v{CACHE_VERSION}" / key
+
+
+# Store each column as its own .npy file (timestamps stay datetime64) plus a
+# small meta.json. Text columns are saved as fixed-width strings with a
+# separate missing-value mask, so NaN does not come back as the string 'nan'.
+# Entries are written to a temporary folder and renamed into place so that a
+# crash never leaves a half-written entry behind.
+def write_cache(df, cache_dir, key):
+    entry = _entry_dir(cache_dir, key)
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=entry.parent, prefix=".tmp-"))
+    try:
+        columns, dtypes, masked = [], [], []
+        for i, col in enumerate(df.columns):
+            values = df[col].to_numpy()
+            if values.dtype == object:
+                missing = pd.isna(values)
+                if missing.any():
+                    np.save(tmp / f"{i}.na.npy", missing, allow_pickle=False)
+                    masked.append(i)
+                values = np.where(missing, "", values).astype(str)
+            np.save(tmp / f"{i}.npy", values, allow_pickle=False)
+            columns.append(col)
+            dtypes.append(str(df[col].dtype))
+        with open(tmp / "meta.json", "w") as f:
+            json.dump({"columns": columns, "dtypes": dtypes, "masked": masked, "rows": len(df)}, f)
+        try:
+            os.replace(tmp, entry)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(tmp, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return entry
+
+
+def _read_column(entry, i, dtype, masked, mmap):
+    values = np.load(entry / f"{i}.npy", mmap_mode="r" if mmap else None, allow_pickle=False)
+    if values.dtype.kind != "U":
+        return values
+    values = values.astype(object)
+    if masked:
+        values[np.load(entry / f"{i}.na.npy", allow_pickle=False)] = np.nan
+    return pd.Series(values, dtype=object if dtype == "object" else dtype, copy=False)
+
+
+# Read a cached entry; returns None on a miss. By default the columns are
+# loaded into ordinary writable arrays. With mmap=True numeric columns are
+# read-only memory maps instead (faster for large files, but the frame must
+# not be modified in place).
+def read_cache(cache_dir, key, mmap=False):
+    entry = _entry_dir(cache_dir, key)
+    meta_path = entry / "meta.json"
+    if not meta_path.exists():
+        return None
+    with open(meta_path) as f:
+        meta = json.load(f)
+    masked = set(meta["masked"])
+    data = {
+        col: _read_column(entry, i, dtype, i in masked, mmap)
+        for i, (col, dtype) in enumerate(zip(meta["columns"], meta["dtypes"]))
+    }
+    return pd.DataFrame(data, copy=False)
+
+
+# Drop-in replacement for pd.read_csv(path, parse_dates=["timestamp"]) that
+# parses each distinct file only once. The key is the hash of the file
+# contents and of parse_dates, so edited or replaced files (or a different
+# date column list) are re-parsed automatically.
+def load_era5_cached(path, cache_dir=DEFAULT_CACHE_DIR, parse_dates=("timestamp",)):
+    parse_dates = list(parse_dates)
+    key = hashlib.sha256(f"{file_hash(path)}:{json.dumps(parse_dates)}".encode()).hexdigest()
+    df = read_cache(cache_dir, key)
+    if df is None:
+        df = pd.read_csv(path, parse_dates=parse_dates)
+        write_cache(df, cache_dir, key)
+    return df
+
+
+def clear_cache(cache_dir=DEFAULT_CACHE_DIR):
+    shutil.rmtree(cache_dir, ignore_errors=True)
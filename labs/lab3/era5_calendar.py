@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+# Calendar keys supported by aggregate_calendar. Seasons follow the lab3
+# convention: 1 = Winter (DJF), 2 = Spring, 3 = Summer, 4 = Fall.
+CALENDAR_KEYS = ("year", "month", "season", "hour")
+
+
+# Integer calendar fields straight from a datetime64 array (any unit), without
+# building pandas datetime accessors. Returns {key: int64 array of labels}.
+def calendar_fields(timestamps, keys=CALENDAR_KEYS):
+    t = np.asarray(timestamps)
+    if not np.issubdtype(t.dtype, np.datetime64):
+        t = pd.to_datetime(t).to_numpy()
+
+    fields = {}
+    months = None
+    if {"year", "month", "season"} & set(keys):
+        months = t.astype("datetime64[M]").astype(np.int64)
+    for key in keys:
+        if key == "year":
+            fields[key] = months // 12 + 1970
+        elif key == "month":
+            fields[key] = months % 12 + 1
+        elif key == "season":
+            fields[key] = (months % 12 + 1) % 12 // 3 + 1
+        elif key == "hour":
+            fields[key] = t.astype("datetime64[h]").astype(np.int64) % 24
+        else:
+            raise ValueError(f"Unknown calendar key: {key} (use {', '.join(CALENDAR_KEYS)})")
+    return fields
+
+
+# Sum, count, mean, min and max of values for every combination of the given
+# calendar keys (and optional group labels such as a site key), in one pass.
+# The keys are folded into a single integer bucket code, so each statistic is
+# one bincount / ufunc.at over the data regardless of how many keys are used.
+# NaN values are skipped. Nothing is written to the caller's arrays or frames.
+def aggregate_calendar(timestamps, values, keys=("month",), groups=None, group_name="site"):
+    if not keys and groups is None:
+        raise ValueError("At least one calendar key or a groups array is required")
+    values = np.asarray(values, dtype=float)
+    fields = calendar_fields(timestamps, keys)
+
+    level_codes, level_labels, level_names = [], [], []
+    if groups is not None:
+        codes, labels = pd.factorize(groups, sort=True)
+        level_codes.append(codes)
+        level_labels.append(np.asarray(labels))
+        level_names.append(group_name)
+    for key in keys:
+        labels, codes = np.unique(fields[key], return_inverse=True)
+        level_codes.append(codes.ravel())
+        level_labels.append(labels)
+        level_names.append(key)
+
+    sizes = [len(labels) for labels in level_labels]
+    bucket = np.zeros(len(values), dtype=np.int64)
+    for codes, size in zip(level_codes, sizes):
+        bucket = bucket * size + codes
+
+    valid = ~np.isnan(values)
+    if groups is not None:
+        valid &= level_codes[0] >= 0
+    bucket, values = bucket[valid], values[valid]
+
+    n_buckets = int(np.prod(sizes))
+    count = np.bincount(bucket, minlength=n_buckets)
+    total = np.bincount(bucket, weights=values, minlength=n_buckets)
+    vmin = np.full(n_buckets, np.inf)
+    vmax = np.full(n_buckets, -np.inf)
+    np.minimum.at(vmin, bucket, values)
+    np.maximum.at(vmax, bucket, values)
+
+    present = np.flatnonzero(count)
+    arrays = [labels[codes] for labels, codes in zip(level_labels, np.unravel_index(present, sizes))]
+    if len(arrays) == 1:
+        index = pd.Index(arrays[0], name=level_names[0])
+    else:
+        index = pd.MultiIndex.from_arrays(arrays, names=level_names)
+    return pd.DataFrame({
+        "sum": total[present],
+        "count": count[present],
+        "mean": total[present] / count[present],
+        "min": vmin[present],
+        "max": vmax[present],
+    }, index=index)
+
+
+# Combine an aggregate_calendar table into coarser buckets (e.g. month -> season)
+# using only the per-bucket statistics.
+def rollup(table, by):
+    grouped = table.groupby(by, observed=True)
+    result = grouped.agg({"sum": "sum", "count": "sum", "min": "min", "max": "max"})
+    result.insert(2, "mean", result["sum"] / result["count"])
+    return result
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+
+from era5_batch import add_wind_fields, finalize_aggregations, merge_monthly_sums, monthly_sums
+
+# Names used by the different ERA5 NetCDF exports (old CDS / new CDS / lab CSVs)
+U_NAMES = ["u10", "u10m"]
+V_NAMES = ["v10", "v10m"]
+TIME_NAMES = ["valid_time", "time"]
+LAT_NAMES = ["latitude", "lat"]
+LON_NAMES = ["longitude", "lon"]
+
+
+def _pick(names, available, what):
+    for name in names:
+        if name in available:
+            return name
+    raise KeyError(f"No {what} found (tried {', '.join(names)})")
+
+
+def _bounds_slice(values, low, high):
+    # Works for ascending and descending coordinates (ERA5 latitude is descending)
+    if low is None and high is None:
+        return slice(None)
+    low = -np.inf if low is None else low
+    high = np.inf if high is None else high
+    idx = np.flatnonzero((values >= low) & (values <= high))
+    if len(idx) == 0:
+        raise ValueError(f"No grid points between {low} and {high}")
+    return slice(idx[0], idx[-1] + 1)
+
+
+# Open a local ERA5 NetCDF file lazily (nothing is read yet) and cut it down to
+# the grid boxes inside the lat/lon bounds. Requires xarray and a NetCDF backend.
+def open_era5_grid(path, lat_bounds=(None, None), lon_bounds=(None, None)):
+    try:
+        import xarray as xr
+    except ImportError:
+        raise ImportError("Reading NetCDF requires xarray: pip install xarray netCDF4")
+
+    ds = xr.open_dataset(path)
+    names = {
+        "u": _pick(U_NAMES, ds.data_vars, "u wind component"),
+        "v": _pick(V_NAMES, ds.data_vars, "v wind component"),
+        "time": _pick(TIME_NAMES, ds.coords, "time coordinate"),
+        "lat": _pick(LAT_NAMES, ds.coords, "latitude coordinate"),
+        "lon": _pick(LON_NAMES, ds.coords, "longitude coordinate"),
+    }
+    ds = ds[[names["u"], names["v"]]].isel({
+        names["lat"]: _bounds_slice(ds[names["lat"]].values, *lat_bounds),
+        names["lon"]: _bounds_slice(ds[names["lon"]].values, *lon_bounds),
+    })
+    return ds, names
+
+
+# Yield the grid in time chunks as long DataFrames with the same columns as the
+# lab CSV extracts (timestamp, u10m, v10m, lat, lon) plus a "site" key per grid
+# box. Only one time chunk is held in memory at a time.
+def iter_era5_chunks(path, lat_bounds=(None, None), lon_bounds=(None, None), time_chunk=744):
+    ds, names = open_era5_grid(path, lat_bounds, lon_bounds)
+    try:
+        lat = ds[names["lat"]].values
+        lon = ds[names["lon"]].values
+        lat_grid, lon_grid = np.meshgrid(lat, lon, indexing="ij")
+        lat_flat = lat_grid.ravel()
+        lon_flat = lon_grid.ravel()
+        sites = pd.Categorical([f"{a:.2f}_{b:.2f}" for a, b in zip(lat_flat, lon_flat)])
+        n_points = len(lat_flat)
+
+        n_times = ds.sizes[names["time"]]
+        for start in range(0, n_times, time_chunk):
+            block = ds.isel({names["time"]: slice(start, start + time_chunk)})
+            block = block.transpose(names["time"], names["lat"], names["lon"], ...)
+            times = block[names["time"]].values
+            u = block[names["u"]].values.reshape(len(times), n_points)
+            v = block[names["v"]].values.reshape(len(times), n_points)
+
+            yield pd.DataFrame({
+                "timestamp": np.repeat(times, n_points),
+                "u10m": u.ravel(),
+                "v10m": v.ravel(),
+                "lat": np.tile(lat_flat, len(times)),
+                "lon": np.tile(lon_flat, len(times)),
+                "site": sites.take(np.tile(np.arange(n_points), len(times))),
+            })
+    finally:
+        ds.close()
+
+
+# Monthly and seasonal mean wind speed for every grid box inside the bounds,
+# accumulated chunk by chunk with the same functions as the CSV batch path.
+def aggregate_era5_grid(path, lat_bounds=(None, None), lon_bounds=(None, None), time_chunk=744):
+    partials = [
+        monthly_sums(add_wind_fields(chunk))
+        for chunk in iter_era5_chunks(path, lat_bounds, lon_bounds, time_chunk)
+    ]
+    return finalize_aggregations(merge_monthly_sums(partials))
+
+
+def main():
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python era5_netcdf.py <era5_file.nc> [south north west east]")
+        return
+    bounds = [float(b) for b in sys.argv[2:6]] if len(sys.argv) >= 6 else [None] * 4
+    monthly_avg, seasonal_avg = aggregate_era5_grid(
+        sys.argv[1], lat_bounds=bounds[0:2], lon_bounds=bounds[2:4]
+    )
+    print("Monthly averages:\n", monthly_avg.round(2))
+    print("\nSeasonal averages:\n", seasonal_avg.round(2))
+
+
+if __name__ == "__main__":
+    main()
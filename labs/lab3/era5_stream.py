@@ -0,0 +1,151 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from era5_batch import SEASONS, add_wind_fields
+from era5_calendar import aggregate_calendar
+
+DEFAULT_WINDOWS = ("24h", "7D")
+
+
+# Trailing time window (t_last - width, t_last] over one site's wind speeds.
+# Keeps a running sum / sum of squares and monotonic deques for min and max,
+# so every sample is pushed and popped at most once.
+class RollingWindow:
+    def __init__(self, width):
+        self.width = pd.Timedelta(width).value
+        self.samples = deque()
+        self.min_q = deque()
+        self.max_q = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def push(self, t, value):
+        self.samples.append((t, value))
+        self.total += value
+        self.total_sq += value * value
+        while self.min_q and self.min_q[-1][1] > value:
+            self.min_q.pop()
+        self.min_q.append((t, value))
+        while self.max_q and self.max_q[-1][1] < value:
+            self.max_q.pop()
+        self.max_q.append((t, value))
+
+    def expire(self, now):
+        start = now - self.width
+        while self.samples and self.samples[0][0] <= start:
+            _, value = self.samples.popleft()
+            self.total -= value
+            self.total_sq -= value * value
+        while self.min_q and self.min_q[0][0] <= start:
+            self.min_q.popleft()
+        while self.max_q and self.max_q[0][0] <= start:
+            self.max_q.popleft()
+
+    def stats(self):
+        n = len(self.samples)
+        if n == 0:
+            return {"count": 0, "mean": np.nan, "std": np.nan, "min": np.nan, "max": np.nan}
+        mean = self.total / n
+        var = max(self.total_sq / n - mean * mean, 0.0) * n / (n - 1) if n > 1 else np.nan
+        return {"count": n, "mean": mean, "std": np.sqrt(var),
+                "min": self.min_q[0][1], "max": self.max_q[0][1]}
+
+
+# Stateful wind-speed aggregator for appended ERA5 rows. Holds per-site running
+# sums, counts and extrema for every month and season plus trailing rolling
+# windows, so each update costs time proportional to the new rows only.
+# Rows must arrive in time order per site.
+class StreamingWindAggregator:
+    def __init__(self, windows=DEFAULT_WINDOWS):
+        self.windows = tuple(windows)
+        self.monthly = None  # (site, month) -> sum/count/min/max
+        self.rolling = {}    # site -> {window: RollingWindow}
+        self.last_seen = {}  # site -> last timestamp (int64 ns)
+
+    # Accept new rows with "site", "timestamp" and either "wind_speed" or u10m/v10m
+    def update(self, df):
+        if df.empty:
+            return self
+        if "wind_speed" not in df.columns:
+            df = add_wind_fields(df)
+
+        times = df["timestamp"].to_numpy().astype("datetime64[ns]").astype(np.int64)
+        speeds = df["wind_speed"].to_numpy(dtype=float)
+        sites = df["site"].to_numpy()
+
+        self._update_calendar(df["timestamp"].to_numpy(), speeds, sites)
+        self._update_rolling(times, speeds, sites)
+        return self
+
+    def _update_calendar(self, timestamps, speeds, sites):
+        new = aggregate_calendar(timestamps, speeds, keys=("month",), groups=sites)
+        new = new[["sum", "count", "min", "max"]]
+        if self.monthly is None:
+            self.monthly = new
+            return
+        merged = pd.concat([self.monthly, new])
+        self.monthly = merged.groupby(level=["site", "month"]).agg(
+            {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+        )
+
+    def _update_rolling(self, times, speeds, sites):
+        order = np.argsort(sites, kind="stable")
+        sites, times, speeds = sites[order], times[order], speeds[order]
+        bounds = np.flatnonzero(sites[1:] != sites[:-1]) + 1
+        for start, end in zip(np.r_[0, bounds], np.r_[bounds, len(sites)]):
+            site = sites[start]
+            t, v = times[start:end], speeds[start:end]
+            last = self.last_seen.get(site)
+            if np.any(np.diff(t) < 0) or (last is not None and t[0] < last):
+                raise ValueError(f"Rows for site {site} must be appended in time order")
+
+            windows = self.rolling.setdefault(
+                site, {w: RollingWindow(w) for w in self.windows}
+            )
+            for window in windows.values():
+                for ti, vi in zip(t.tolist(), v.tolist()):
+                    if vi == vi:  # skip NaN
+                        window.push(ti, vi)
+                window.expire(int(t[-1]))
+            self.last_seen[site] = int(t[-1])
+
+    def monthly_means(self):
+        return (self.monthly["sum"] / self.monthly["count"]).unstack("month")
+
+    def seasonal_means(self):
+        season = self.monthly.index.get_level_values("month") % 12 // 3 + 1
+        seasonal = self.monthly.groupby([self.monthly.index.get_level_values("site"), season]).sum()
+        seasonal.index.names = ["site", "season"]
+        return (seasonal["sum"] / seasonal["count"]).unstack("season").rename(columns=SEASONS)
+
+    def monthly_extremes(self):
+        return self.monthly[["min", "max"]]
+
+    # Rolling statistics for each site as of its latest timestamp
+    def rolling_stats(self):
+        rows = {}
+        for site, windows in self.rolling.items():
+            for name, window in windows.items():
+                rows[(site, name)] = window.stats()
+        stats = pd.DataFrame.from_dict(rows, orient="index")
+        stats.index.names = ["site", "window"]
+        return stats
+
+
+def main():
+    from era5_batch import load_sites
+
+    combined = load_sites("../../datasets/*_era5_wind_*.csv").sort_values("timestamp")
+    aggregator = StreamingWindAggregator()
+    # Replay the history in daily batches as if each day had just arrived
+    for _, batch in combined.groupby(combined["timestamp"].dt.date):
+        aggregator.update(batch)
+
+    print("Seasonal averages:\n", aggregator.seasonal_means().round(2))
+    print("\nRolling statistics:\n", aggregator.rolling_stats().round(2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from era5_batch import add_wind_fields
+
+# Speed class edges in m/s; the last class is open-ended
+DEFAULT_SPEED_BINS = (0, 2, 4, 6, 8, 10, 15, np.inf)
+COMPASS_16 = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+              "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
+
+
+# Joint speed x direction histograms for many sites. Counts are plain integer
+# arrays per site, so roses built from separate chunks, files or workers can
+# be merged by addition. Plots are drawn from the bins, never from raw samples.
+class WindRose:
+    def __init__(self, speed_bins=DEFAULT_SPEED_BINS, n_sectors=16):
+        self.speed_bins = np.asarray(speed_bins, dtype=float)
+        self.n_sectors = n_sectors
+        self.counts = {}  # site -> int64 array (n_speed_bins, n_sectors)
+
+    @property
+    def n_speed_bins(self):
+        return len(self.speed_bins) - 1
+
+    # Bin rows with "site" and u10m/v10m (or precomputed wind_speed/wind_direction)
+    # for every site in one bincount.
+    def update(self, df):
+        if "wind_direction" not in df.columns:
+            df = add_wind_fields(df)
+        speed = df["wind_speed"].to_numpy(dtype=float)
+        direction = df["wind_direction"].to_numpy(dtype=float)
+        site_codes, sites = pd.factorize(df["site"])
+
+        width = 360.0 / self.n_sectors
+        sector = (np.mod(direction + width / 2, 360.0) // width).astype(np.int64)
+        speed_bin = np.searchsorted(self.speed_bins, speed, side="right") - 1
+
+        valid = ((speed_bin >= 0) & (speed_bin < self.n_speed_bins)
+                 & ~np.isnan(direction) & (site_codes >= 0))
+        cells = self.n_speed_bins * self.n_sectors
+        code = site_codes * cells + speed_bin * self.n_sectors + sector
+        counts = np.bincount(code[valid], minlength=len(sites) * cells)
+        counts = counts.reshape(len(sites), self.n_speed_bins, self.n_sectors)
+
+        for i, site in enumerate(sites):
+            if site in self.counts:
+                self.counts[site] += counts[i]
+            else:
+                self.counts[site] = counts[i].copy()
+        return self
+
+    def merge(self, other):
+        if not (np.array_equal(self.speed_bins, other.speed_bins) and self.n_sectors == other.n_sectors):
+            raise ValueError("Wind roses must use the same speed bins and sectors to be merged")
+        for site, counts in other.counts.items():
+            if site in self.counts:
+                self.counts[site] += counts
+            else:
+                self.counts[site] = counts.copy()
+        return self
+
+    def sector_labels(self):
+        if self.n_sectors == 16:
+            return COMPASS_16
+        return [f"{i * 360 / self.n_sectors:g}" for i in range(self.n_sectors)]
+
+    def speed_labels(self):
+        edges = self.speed_bins
+        return [f"{a:g}-{b:g}" if np.isfinite(b) else f">{a:g}" for a, b in zip(edges[:-1], edges[1:])]
+
+    # Relative frequency (in %) of each speed class and direction sector for a site
+    def frequencies(self, site):
+        counts = self.counts[site]
+        total = counts.sum()
+        freq = 100.0 * counts / total if total else counts.astype(float)
+        return pd.DataFrame(freq, index=self.speed_labels(), columns=self.sector_labels())
+
+    def plot(self, site, ax=None, cmap="viridis"):
+        freq = self.frequencies(site).to_numpy()
+        if ax is None:
+            _, ax = plt.subplots(figsize=(7, 7), subplot_kw={"projection": "polar"})
+        ax.set_theta_zero_location("N")
+        ax.set_theta_direction(-1)
+
+        theta = np.arange(self.n_sectors) * 2 * np.pi / self.n_sectors
+        width = 2 * np.pi / self.n_sectors * 0.9
+        colors = plt.get_cmap(cmap)(np.linspace(0, 1, self.n_speed_bins))
+        bottom = np.zeros(self.n_sectors)
+        for i, label in enumerate(self.speed_labels()):
+            ax.bar(theta, freq[i], width=width, bottom=bottom, color=colors[i],
+                   edgecolor="white", linewidth=0.5, label=f"{label} m/s")
+            bottom += freq[i]
+
+        ax.set_xticks(theta[::max(1, self.n_sectors // 8)])
+        ax.set_xticklabels(self.sector_labels()[::max(1, self.n_sectors // 8)])
+        ax.set_title(f"Wind Rose - {site}")
+        ax.legend(loc="lower left", bbox_to_anchor=(1.0, 0.0), fontsize=8)
+        return ax
+
+
+def main():
+    from era5_batch import load_sites
+
+    combined = load_sites("../../datasets/*_era5_wind_*.csv")
+    rose = WindRose().update(combined)
+
+    sites = list(rose.counts)
+    fig, axes = plt.subplots(1, len(sites), figsize=(7 * len(sites), 7),
+                             subplot_kw={"projection": "polar"}, squeeze=False)
+    for ax, site in zip(axes[0], sites):
+        rose.plot(site, ax=ax)
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,34 +3,44 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from era5_cache import load_era5_cached
+from era5_calendar import aggregate_calendar, rollup
+
 # Files
 berlin_file = '../../datasets/berlin_era5_wind_20241231_20241231.csv'
 munich_file = '../../datasets/munich_era5_wind_20241231_20241231.csv'
 
 
-# Loading the data
-def load_data(file_path):
+# Loading the data. With use_cache the parsed series is kept in a binary
+# cache (see era5_cache.py) so the timestamps are only parsed once per file.
+def load_data(file_path, use_cache=False):
     try:
-        df = pd.read_csv(file_path, parse_dates=["timestamp"])
+        if use_cache:
+            df = load_era5_cached(file_path)
+        else:
+            df = pd.read_csv(file_path, parse_dates=["timestamp"])
         print(f"{file_path} is loaded.")
-        print("\nData info:", df.info())
+        print("\nData info:")
+        df.info()
         return df
     except Exception as e:
         print(f"Error: {e}")
         return None
 
-#calculate the wind speed
+#calculate the wind speed (returns a new frame, the input is not modified)
 def calculate_wind_speed(df):
-    df["wind_speed"] = np.sqrt(df["u10m"] ** 2 + df["v10m"] ** 2)
-    return df
+    return df.assign(wind_speed=np.hypot(df["u10m"].to_numpy(), df["v10m"].to_numpy()))
 
 
 # seasonal and monthly averages.
+# One bincount pass over the raw arrays covers all 12 months; the seasons (1: Winter,
+# 2: Spring, 3: Summer, 4: Fall) are rolled up from the 12 monthly buckets.
+# No columns are added to df.
 def compute_aggregations(df):
-    df["month"] = df["timestamp"].dt.month
-    df["season"] = df["timestamp"].dt.month % 12 // 3 + 1  # 1: Winter, 2: Spring, 3: Summer, 4: Fall
-    monthly_avg = df.groupby("month")["wind_speed"].mean()
-    seasonal_avg = df.groupby("season")["wind_speed"].mean()
+    monthly = aggregate_calendar(df["timestamp"].to_numpy(), df["wind_speed"].to_numpy(), keys=("month",))
+    seasonal = rollup(monthly, pd.Index(monthly.index % 12 // 3 + 1, name="season"))
+    monthly_avg = monthly["mean"].rename("wind_speed")
+    seasonal_avg = seasonal["mean"].rename("wind_speed")
     return monthly_avg, seasonal_avg
 
 
@@ -46,20 +56,104 @@ def plot_wind_speed_trends(berlin_df, munich_df):
     plt.show()
 
 
+# Largest-Triangle-Three-Buckets downsampling: keeps the visual shape of a
+# long series using n_out points (first and last point are always kept).
+def lttb_downsample(x, y, n_out):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Bucket edges for the n_out - 2 inner buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average point of the next bucket (or the last point)
+        next_start = end
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Pick the point forming the largest triangle with a and the average
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+# Min/max bucket downsampling: keeps the extremes of every bucket, fully vectorized.
+def minmax_downsample(y, n_buckets):
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if 2 * n_buckets >= n or n_buckets < 1:
+        return np.arange(n)
+
+    edges = np.linspace(0, n, n_buckets + 1).astype(int)
+    bucket = np.repeat(np.arange(n_buckets), np.diff(edges))
+    # Sort each bucket by value; the first and last entries are its min and max
+    order = np.lexsort((y, bucket))
+    idx = np.concatenate([order[edges[:-1]], order[edges[1:] - 1]])
+    return np.unique(idx)
+
+
+# Fast trend plot for any number of sites. site_dfs maps a label to a DataFrame
+# with "timestamp" and "wind_speed". Every series is downsampled to the pixel
+# width of the axes and drawn with plain plot() (no seaborn CI bootstrap).
+def plot_wind_speed_trends_downsampled(site_dfs, method="lttb", width_px=None,
+                                       figsize=(12, 6), dpi=100):
+    fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+    if width_px is None:
+        width_px = int(ax.get_window_extent().width)
+
+    for label, df in site_dfs.items():
+        df = df.sort_values("timestamp")
+        x = df["timestamp"].to_numpy()
+        y = df["wind_speed"].to_numpy()
+        if method == "lttb":
+            idx = lttb_downsample(x.astype("datetime64[ns]").astype(np.int64), y, width_px)
+        elif method == "minmax":
+            idx = minmax_downsample(y, width_px // 2)
+        else:
+            raise ValueError(f"Unknown downsampling method: {method}")
+        ax.plot(x[idx], y[idx], linewidth=1, label=label)
+
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Wind Speed (m/s)")
+    ax.set_title("Wind Speed Trends")
+    ax.legend()
+    return fig
+
+
 #Main Code
-berlin_df = load_data(berlin_file)
-munich_df = load_data(munich_file)
+def main():
+    berlin_df = load_data(berlin_file, use_cache=True)
+    munich_df = load_data(munich_file, use_cache=True)
+
+    if berlin_df is not None and munich_df is not None:
+        berlin_df = calculate_wind_speed(berlin_df)
+        munich_df = calculate_wind_speed(munich_df)
+
+        berlin_monthly, berlin_seasonal = compute_aggregations(berlin_df)
+        munich_monthly, munich_seasonal = compute_aggregations(munich_df)
 
-if berlin_df is not None and munich_df is not None:
-    berlin_df = calculate_wind_speed(berlin_df)
-    munich_df = calculate_wind_speed(munich_df)
+        print("Berlin Monthly averages:\n", berlin_monthly)
+        print("Berlin Seasonal averages:\n", berlin_seasonal)
+        print("Munich Monthly averages:\n", munich_monthly)
+        print("Munich Seasonal averages:\n", munich_seasonal)
 
-    berlin_monthly, berlin_seasonal = compute_aggregations(berlin_df)
-    munich_monthly, munich_seasonal = compute_aggregations(munich_df)
+        plot_wind_speed_trends_downsampled({"Berlin": berlin_df, "Munich": munich_df})
+        plt.show()
 
-    print("Berlin Monthly averages:\n", berlin_monthly)
-    print("Berlin Seasonal averages:\n", berlin_seasonal)
-    print("Munich Monthly averages:\n", munich_monthly)
-    print("Munich Seasonal averages:\n", munich_seasonal)
 
-    plot_wind_speed_trends(berlin_df, munich_df)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from era5_batch import load_sites  # noqa: E402
+
+BERLIN = Path(__file__).resolve().parents[3] / "datasets" / "berlin_era5_wind_20241231_20241231.csv"
+
+
+def test_load_sites_two_files_for_one_site(tmp_path):
+    """Test that yearly extracts of the same site share one category."""
+    source = pd.read_csv(BERLIN)
+    source.to_csv(tmp_path / "berlin_era5_wind_2023.csv", index=False)
+    source.to_csv(tmp_path / "berlin_era5_wind_2024.csv", index=False)
+    source.to_csv(tmp_path / "munich_era5_wind_2024.csv", index=False)
+
+    combined = load_sites(str(tmp_path / "*_era5_wind_*.csv"), max_workers=1)
+
+    assert list(combined["site"].cat.categories) == ["berlin", "munich"]
+    assert (combined["site"] == "berlin").sum() == 2 * len(source)
@@ -0,0 +1,67 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from lab5 import fill_missing_values
+
+# Column layout of Concrete_Data.xls: 7 mix components, age, strength
+COLUMNS = ['Cement', 'Blast Furnace Slag', 'Fly Ash', 'Water', 'Superplasticizer',
+           'Coarse Aggregate', 'Fine Aggregate', 'Age (day)', 'Concrete compressive strength']
+AGES = [1, 3, 7, 14, 28, 56, 90, 91, 100, 120, 180, 270, 360, 365]
+
+
+# Previous implementation (one masked subset per age), kept as the reference
+def fill_missing_values_loop(df):
+    filled_df = df.copy()
+    age_col = filled_df.columns[7]
+    for age in filled_df[age_col].unique():
+        age_group = filled_df[filled_df[age_col] == age]
+        means = age_group.mean()
+        filled_df.loc[filled_df[age_col] == age] = age_group.fillna(means)
+    return filled_df
+
+
+# Synthetic concrete-mix data with the same columns and ages as the real set
+def make_concrete_data(n_rows, missing_rate=0.05, seed=0):
+    rng = np.random.default_rng(seed)
+    low = np.array([102, 0, 0, 121, 0, 801, 594])
+    high = np.array([540, 359, 200, 247, 32, 1145, 993])
+    mix = low + rng.random((n_rows, 7)) * (high - low)
+    age = rng.choice(AGES, n_rows).astype(float)
+    strength = 0.08 * mix[:, 0] - 0.15 * mix[:, 3] + 8 * np.log(age) + rng.normal(0, 5, n_rows)
+    df = pd.DataFrame(np.column_stack([mix, age, strength]), columns=COLUMNS)
+
+    mask = rng.random(df.shape) < missing_rate
+    mask[:, 7] = False  # the age is always known
+    return df.mask(mask)
+
+
+def time_call(func, df):
+    start = time.perf_counter()
+    result = func(df)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark group-mean imputation.')
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    df = make_concrete_data(args.rows, seed=args.seed)
+    print(f"{args.rows:,} rows, {int(df.isna().sum().sum()):,} missing values")
+
+    loop_result, loop_time = time_call(fill_missing_values_loop, df)
+    print(f"Loop over ages:     {loop_time:.2f} s")
+    vec_result, vec_time = time_call(fill_missing_values, df)
+    print(f"Grouped transform:  {vec_time:.2f} s  ({loop_time / vec_time:.1f}x faster)")
+
+    # Same values up to floating-point rounding of the group means
+    pd.testing.assert_frame_equal(vec_result, loop_result, check_exact=False, rtol=1e-12)
+    print("Results match.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import Lasso, LinearRegression, Ridge
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from lab5 import fill_missing_values
+
+MODELS = {
+    'linear': LinearRegression(),
+    'ridge': make_pipeline(StandardScaler(), Ridge(alpha=1.0)),
+    'lasso': make_pipeline(StandardScaler(), Lasso(alpha=0.1)),
+    'random_forest': RandomForestRegressor(n_estimators=200, random_state=42, n_jobs=1),
+    'gradient_boosting': GradientBoostingRegressor(random_state=42),
+}
+
+# Column positions in Concrete_Data.xls (7 mix components, then age)
+FEATURE_SETS = {
+    'all': list(range(8)),
+    'binder_water_age': [0, 1, 2, 3, 4, 7],
+    'mix_only': list(range(7)),
+}
+
+
+# Fold number of every row for shuffled k-fold CV. The assignment depends only
+# on the row count, k and seed, so it is computed once and reused by every
+# model and feature set.
+@lru_cache(maxsize=8)
+def fold_assignment(n_rows, n_splits=5, seed=42):
+    order = np.random.default_rng(seed).permutation(n_rows)
+    folds = np.empty(n_rows, dtype=np.int32)
+    for fold, rows in enumerate(np.array_split(order, n_splits)):
+        folds[rows] = fold
+    folds.flags.writeable = False
+    return folds
+
+
+def _to_shared(array):
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+# Per-worker views of the shared arrays, set up once by the pool initializer
+_shared = {}
+
+
+def _attach(specs):
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _shared[key] = (shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf))
+
+
+def _run_task(task):
+    model_name, model, set_name, columns, fold = task
+    X, y, folds = _shared['X'][1], _shared['y'][1], _shared['folds'][1]
+    test = folds == fold
+    # Only the selected rows and columns are copied out of shared memory
+    X_train, X_test = X[np.ix_(~test, columns)], X[np.ix_(test, columns)]
+
+    start = time.perf_counter()
+    fitted = clone(model).fit(X_train, y[~test])
+    fit_s = time.perf_counter() - start
+    y_pred = fitted.predict(X_test)
+    return {
+        'model': model_name, 'features': set_name, 'fold': fold,
+        'r2': r2_score(y[test], y_pred),
+        'rmse': float(np.sqrt(mean_squared_error(y[test], y_pred))),
+        'mae': mean_absolute_error(y[test], y_pred),
+        'fit_s': fit_s,
+    }
+
+
+def run_sweep(X, y, models=None, feature_sets=None, n_splits=5, seed=42, max_workers=None):
+    """
+    K-fold cross-validation of every model on every feature set.
+
+    X and y are copied once into shared memory; worker processes attach to
+    that block instead of receiving a pickled copy per task. Returns
+    (per-fold results, summary per model and feature set, wall time in s).
+    """
+    models = MODELS if models is None else models
+    feature_sets = FEATURE_SETS if feature_sets is None else feature_sets
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    folds = fold_assignment(len(y), n_splits, seed)
+
+    tasks = [(model_name, model, set_name, columns, fold)
+             for model_name, model in models.items()
+             for set_name, columns in feature_sets.items()
+             for fold in range(n_splits)]
+
+    start = time.perf_counter()
+    blocks = {'X': _to_shared(X), 'y': _to_shared(y), 'folds': _to_shared(folds)}
+    specs = {key: spec for key, (_, spec) in blocks.items()}
+    try:
+        if max_workers == 1:
+            _attach(specs)
+            results = [_run_task(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach,
+                                     initargs=(specs,)) as executor:
+                results = list(executor.map(_run_task, tasks))
+    finally:
+        for shm, _ in list(_shared.values()):
+            shm.close()
+        _shared.clear()
+        for shm, _ in blocks.values():
+            shm.close()
+            shm.unlink()
+    wall_s = time.perf_counter() - start
+
+    results = pd.DataFrame(results)
+    summary = (results.groupby(['model', 'features'])
+               .agg(r2_mean=('r2', 'mean'), r2_std=('r2', 'std'),
+                    rmse_mean=('rmse', 'mean'), mae_mean=('mae', 'mean'),
+                    fit_s=('fit_s', 'sum'))
+               .sort_values('r2_mean', ascending=False))
+    return results, summary, wall_s
+
+
+def main():
+    parser = argparse.ArgumentParser(description='K-fold model sweep for concrete strength.')
+    parser.add_argument('--data', default='../../datasets/concrete_strength/Concrete_Data.xls')
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        df = pd.read_excel(args.data)
+    except FileNotFoundError:
+        print(f"Error: File not found at {args.data}")
+        return
+    df = fill_missing_values(df).dropna()
+
+    _, summary, wall_s = run_sweep(df.iloc[:, :-1], df.iloc[:, -1],
+                                   n_splits=args.folds, max_workers=args.workers)
+    print(summary.round(4).to_string())
+    print(f"\n{len(MODELS)} models x {len(FEATURE_SETS)} feature sets x {args.folds} folds "
+          f"in {wall_s:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+import argparse
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+
+# Ordinary least squares fitted from chunks of rows. Instead of the raw XᵀX and
+# Xᵀy sums it keeps the row count, the column means and the centered
+# co-moment matrix of [X, y] (the multivariate form of the Welford / Chan et
+# al. update used by the lab1 accumulators), which avoids the cancellation
+# raw sums suffer from with large, uncentered features such as kg/m³ doses.
+# Memory is O(p²) for p features, whatever the number of rows.
+class IncrementalOLS:
+    def __init__(self, n_features=None):
+        self.n = 0
+        self.mean = None
+        self.comoment = None
+        if n_features is not None:
+            self._reset(n_features)
+
+    def _reset(self, n_features):
+        self.mean = np.zeros(n_features + 1)
+        self.comoment = np.zeros((n_features + 1, n_features + 1))
+
+    @property
+    def n_features(self):
+        return None if self.mean is None else len(self.mean) - 1
+
+    def partial_fit(self, X, y):
+        """Fold a chunk of rows into the running moments."""
+        Z = np.column_stack([np.asarray(X, dtype=float), np.asarray(y, dtype=float)])
+        if len(Z) == 0:
+            return self
+        chunk = IncrementalOLS()
+        chunk.n = len(Z)
+        chunk.mean = Z.mean(axis=0)
+        centered = Z - chunk.mean
+        chunk.comoment = centered.T @ centered
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """Combine with moments accumulated elsewhere, e.g. by another worker."""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean, self.comoment = other.n, other.mean.copy(), other.comoment.copy()
+            return self
+        if other.n_features != self.n_features:
+            raise ValueError(f"Feature count mismatch: {self.n_features} vs {other.n_features}")
+
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.comoment += other.comoment + np.outer(delta, delta) * (self.n * other.n / n)
+        self.mean += delta * (other.n / n)
+        self.n = n
+        return self
+
+    def solve(self):
+        """Return (coef, intercept) for the rows seen so far."""
+        if self.n == 0:
+            raise ValueError("No rows have been added")
+        p = self.n_features
+        sxx, sxy = self.comoment[:p, :p], self.comoment[:p, p]
+        # lstsq falls back to the minimum-norm solution for collinear features,
+        # as LinearRegression does
+        coef = np.linalg.lstsq(sxx, sxy, rcond=None)[0]
+        intercept = self.mean[p] - self.mean[:p] @ coef
+        return coef, intercept
+
+    def predict(self, X):
+        coef, intercept = self.solve()
+        return np.asarray(X, dtype=float) @ coef + intercept
+
+    def to_linear_regression(self, feature_names=None):
+        """A fitted sklearn LinearRegression, e.g. for ModelStore or BatchedPredictor."""
+        model = LinearRegression()
+        model.coef_, model.intercept_ = self.solve()
+        model.n_features_in_ = self.n_features
+        if feature_names is not None:
+            model.feature_names_in_ = np.asarray(feature_names, dtype=object)
+        return model
+
+
+def fit_csv(path, target, features=None, chunksize=100_000):
+    """Stream one CSV in chunks; rows with missing values are skipped."""
+    model = IncrementalOLS()
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        chunk = chunk.dropna()
+        cols = features if features is not None else [c for c in chunk.columns if c != target]
+        model.partial_fit(chunk[cols].to_numpy(), chunk[target].to_numpy())
+    return model
+
+
+def _fit_block(args):
+    X, y = args
+    return IncrementalOLS().partial_fit(X, y)
+
+
+def fit_parallel(blocks, max_workers=None):
+    """
+    Fit (X, y) blocks in a process pool and merge the partial moments.
+
+    Blocks are pulled from the iterable lazily, with at most 2 x max_workers
+    of them in flight, so memory is bounded by that window times the block
+    size however long the stream is. The merged result does not depend on the
+    order in which blocks finish.
+    """
+    model = IncrementalOLS()
+    if max_workers == 1:
+        for block in blocks:
+            model.merge(_fit_block(block))
+        return model
+
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for block in blocks:
+            pending.add(executor.submit(_fit_block, block))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    model.merge(future.result())
+        for future in pending:
+            model.merge(future.result())
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incremental least squares for concrete strength.')
+    parser.add_argument('--data', default='../../datasets/concrete_strength/Concrete_Data.xls')
+    parser.add_argument('--rows', type=int, default=5_000_000, help='synthetic rows to stream')
+    parser.add_argument('--chunk', type=int, default=250_000)
+    args = parser.parse_args()
+
+    from lab5 import fill_missing_values
+
+    try:
+        df = fill_missing_values(pd.read_excel(args.data)).dropna()
+    except FileNotFoundError:
+        print(f"Error: File not found at {args.data}")
+        return
+    X, y = df.iloc[:, :-1].to_numpy(), df.iloc[:, -1].to_numpy()
+
+    incremental = IncrementalOLS()
+    for start in range(0, len(X), 100):
+        incremental.partial_fit(X[start:start + 100], y[start:start + 100])
+    coef, intercept = incremental.solve()
+    batch = LinearRegression().fit(X, y)
+    print(f"Concrete data, 100-row chunks: max |coef diff| = {np.max(np.abs(coef - batch.coef_)):.2e}, "
+          f"|intercept diff| = {abs(intercept - batch.intercept_):.2e}")
+
+    # Synthetic stream generated chunk by chunk, so it never sits in memory at once
+    rng = np.random.default_rng(0)
+    true_coef = batch.coef_
+    scale = X.std(axis=0)
+    offset = X.mean(axis=0)
+
+    def chunks():
+        for start in range(0, args.rows, args.chunk):
+            n = min(args.chunk, args.rows - start)
+            Xc = offset + rng.standard_normal((n, X.shape[1])) * scale
+            yield Xc, Xc @ true_coef + batch.intercept_ + rng.normal(0, 5, n)
+
+    start = time.perf_counter()
+    streamed = fit_parallel(chunks(), max_workers=1)
+    elapsed = time.perf_counter() - start
+    coef, _ = streamed.solve()
+    print(f"{args.rows:,} synthetic rows in {elapsed:.2f} s, "
+          f"max |coef - true| = {np.max(np.abs(coef - true_coef)):.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,8 @@ from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error, r2_score
 
+from model_store import ModelStore
+
 
 def load_data(file_path):
     try:
@@ -24,13 +26,12 @@ def load_data(file_path):
 
 
 def fill_missing_values(df):
-    filled_df = df.copy()
-    age_col = filled_df.columns[7]
-    for age in filled_df[age_col].unique():
-        age_group = filled_df[filled_df[age_col] == age]
-        means = age_group.mean()
-        filled_df.loc[filled_df[age_col] == age] = age_group.fillna(means)
-    return filled_df
+    # Fill gaps with the mean of the same age group, for every feature column at
+    # once: one grouped transform instead of a Python loop over the ages.
+    # Rows without an age are left as they are.
+    age_col = df.columns[7]
+    group_means = df.groupby(age_col).transform('mean')
+    return df.fillna(group_means)
 
 
 def visualize_data(df):
@@ -68,12 +69,26 @@ def split_data(df):
     return train_test_split(X, y, test_size=0.2, random_state=42)
 
 
-def train_evaluate_visualize(X_train, X_test, y_train, y_test):
-    model = LinearRegression().fit(X_train, y_train)
+def train_evaluate_visualize(X_train, X_test, y_train, y_test, store=None, model_params=None):
+    # With a ModelStore, a model fitted earlier on the same cleaned data and
+    # hyperparameters is loaded instead of being refitted.
+    model_params = model_params or {}
+    key = (ModelStore.fingerprint(X_train, y_train, X_test, y_test,
+                                  params={'estimator': 'LinearRegression', **model_params})
+           if store else None)
+    cached = store.load(key) if store else None
+
+    if cached is not None:
+        model = cached['model']
+        print("Loaded cached model.")
+    else:
+        model = LinearRegression(**model_params).fit(X_train, y_train)
     y_pred = model.predict(X_test)
 
     mse = mean_squared_error(y_test, y_pred)
     r2 = r2_score(y_test, y_pred)
+    if store and cached is None:
+        store.save(key, model, X_train.columns, {'mse': mse, 'r2': r2}, params=model_params)
 
     print(f"Mean Squared Error: {mse:.4f}")
     print(f"R² Score: {r2:.4f}")
@@ -106,7 +121,7 @@ def main():
         df = fill_missing_values(df)
         visualize_data(df)
         X_train, X_test, y_train, y_test = split_data(df)
-        train_evaluate_visualize(X_train, X_test, y_train, y_test)
+        train_evaluate_visualize(X_train, X_test, y_train, y_test, store=ModelStore('model_store'))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import joblib
+import pandas as pd
+
+
+# Fitted models keyed by a fingerprint of the cleaned training data and the
+# hyperparameters. Each entry is a folder with the pickled model and a
+# meta.json (feature order, metrics, params). Least recently used entries are
+# evicted once the store exceeds max_entries or max_bytes (pass None for no
+# byte limit).
+class ModelStore:
+    def __init__(self, root='model_store', max_entries=20, max_bytes=256 * 2 ** 20):
+        self.root = Path(root)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(*frames, params=None):
+        digest = hashlib.sha256()
+        for frame in frames:
+            if isinstance(frame, pd.Series):
+                frame = frame.to_frame()
+            digest.update(json.dumps([str(c) for c in frame.columns]).encode())
+            digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+        digest.update(json.dumps(params or {}, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def _entry(self, key):
+        return self.root / key
+
+    def load(self, key):
+        entry = self._entry(key)
+        if not entry.is_dir():
+            return None
+        try:
+            with open(entry / 'meta.json') as f:
+                meta = json.load(f)
+            model = joblib.load(entry / 'model.joblib')
+        except Exception:
+            # Missing or corrupt files count as a miss; drop the entry so it is rebuilt
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+        os.utime(entry)  # mark as recently used
+        return dict(meta, model=model)
+
+    def save(self, key, model, features, metrics, params=None):
+        entry = self._entry(key)
+        tmp = self.root / f'.tmp-{key}-{os.getpid()}'
+        tmp.mkdir(parents=True, exist_ok=True)
+        joblib.dump(model, tmp / 'model.joblib')
+        with open(tmp / 'meta.json', 'w') as f:
+            json.dump({'features': list(map(str, features)), 'metrics': metrics,
+                       'params': params or {}, 'created': time.time()}, f, indent=2, default=str)
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp, entry)
+        self._evict()
+        return entry
+
+    def entries(self):
+        # (path, last_used, size_bytes), oldest first
+        result = []
+        for entry in self.root.iterdir():
+            if entry.is_dir() and not entry.name.startswith('.tmp-'):
+                size = sum(f.stat().st_size for f in entry.iterdir())
+                result.append((entry, entry.stat().st_mtime, size))
+        return sorted(result, key=lambda item: item[1])
+
+    def _evict(self):
+        entries = self.entries()
+        total = sum(size for _, _, size in entries)
+        while entries and (len(entries) > self.max_entries
+                           or (self.max_bytes is not None and total > self.max_bytes)):
+            entry, _, size = entries.pop(0)
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
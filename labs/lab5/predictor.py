@@ -0,0 +1,180 @@
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+# Serves predictions from one fitted regressor. Single mixes submitted from
+# many threads are gathered by a background thread into micro-batches (up to
+# max_batch rows, or whatever arrived within max_wait_ms) and predicted with
+# one vectorized call. Latencies of the last `history` requests are kept for
+# percentile reporting.
+class BatchedPredictor:
+    def __init__(self, model, features=None, max_batch=256, max_wait_ms=1.0, history=100_000):
+        self.model = model
+        self.features = list(features) if features is not None else None
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.latencies = deque(maxlen=history)
+        self._requests = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()  # orders submit() against close()
+
+        # Linear models are evaluated directly as X @ coef + intercept, which
+        # skips the per-call input validation of model.predict
+        coef = getattr(model, 'coef_', None)
+        self._coef = None if coef is None else np.asarray(coef, dtype=float).ravel()
+        self._intercept = float(np.ravel(getattr(model, 'intercept_', 0.0))[0])
+
+        self._worker = threading.Thread(target=self._serve, name='predictor', daemon=True)
+        self._worker.start()
+
+    @classmethod
+    def from_store(cls, store, key, **kwargs):
+        entry = store.load(key)
+        if entry is None:
+            raise KeyError(f"No stored model for key {key}")
+        return cls(entry['model'], entry['features'], **kwargs)
+
+    def _as_array(self, X):
+        if isinstance(X, pd.DataFrame) and self.features is not None:
+            X = X[self.features]
+        X = np.asarray(X, dtype=float)
+        return X[None, :] if X.ndim == 1 else X
+
+    def _predict_batch(self, X):
+        if self._coef is not None:
+            return X @ self._coef + self._intercept
+        if getattr(self.model, 'feature_names_in_', None) is not None:
+            X = pd.DataFrame(X, columns=self.model.feature_names_in_)
+        return np.asarray(self.model.predict(X), dtype=float).ravel()
+
+    def predict(self, X):
+        """Predict one mix (1-D array) or a batch (2-D array) synchronously."""
+        single = np.ndim(X) == 1
+        start = time.perf_counter()
+        y = self._predict_batch(self._as_array(X))
+        self.latencies.append(time.perf_counter() - start)
+        return y[0] if single else y
+
+    def submit(self, x):
+        """Queue one mix (1-D array) for the micro-batcher; returns a Future with the prediction."""
+        if np.ndim(x) != 1:
+            raise ValueError("submit() takes a single mix; use predict() for batches")
+        row = self._as_array(x)[0]
+        future = Future()
+        with self._lock:
+            # Requests queued here always precede the shutdown sentinel
+            if self._closed:
+                raise RuntimeError("Predictor is closed")
+            self._requests.put((row, future, time.perf_counter()))
+        return future
+
+    def predict_one(self, x, timeout=None):
+        return self.submit(x).result(timeout)
+
+    def _serve(self):
+        while True:
+            first = self._requests.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.perf_counter() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._requests.get(timeout=remaining) if remaining > 0 else self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._requests.put(None)  # finish this batch, then stop
+                    break
+                batch.append(item)
+
+            rows, futures, submitted = zip(*batch)
+            try:
+                y = self._predict_batch(np.vstack(rows))
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            done = time.perf_counter()
+            for future, value, t0 in zip(futures, y, submitted):
+                future.set_result(float(value))
+                self.latencies.append(done - t0)
+
+    def percentiles(self, ps=(50, 95, 99)):
+        """Request latency percentiles in milliseconds."""
+        if not self.latencies:
+            return {f'p{p}': np.nan for p in ps}
+        values = np.percentile(np.fromiter(self.latencies, dtype=float), ps) * 1000
+        return {f'p{p}': float(v) for p, v in zip(ps, values)}
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(None)
+        self._worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Stand-in for the QA tool: `clients` threads each send single mixes
+def simulate_clients(predictor, X, clients=16, requests_per_client=2000):
+    def client(seed):
+        rng = np.random.default_rng(seed)
+        for i in rng.integers(len(X), size=requests_per_client):
+            predictor.predict_one(X[i])
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        list(executor.map(client, range(clients)))
+    return clients * requests_per_client / (time.perf_counter() - start)
+
+
+def main():
+    from sklearn.linear_model import LinearRegression
+
+    from lab5 import fill_missing_values, split_data
+    from model_store import ModelStore
+
+    file_path = '../../datasets/concrete_strength/Concrete_Data.xls'
+    try:
+        df = fill_missing_values(pd.read_excel(file_path))
+    except FileNotFoundError:
+        print(f"Error: File not found at {file_path}")
+        return
+    X_train, X_test, y_train, y_test = split_data(df)
+
+    # Same key as lab5.train_evaluate_visualize, so a model stored there is reused
+    store = ModelStore('model_store')
+    params = {'estimator': 'LinearRegression'}
+    key = ModelStore.fingerprint(X_train, y_train, X_test, y_test, params=params)
+    if store.load(key) is None:
+        model = LinearRegression().fit(X_train, y_train)
+        store.save(key, model, X_train.columns, {'r2': model.score(X_test, y_test)}, params)
+
+    X = X_test.to_numpy()
+    with BatchedPredictor.from_store(store, key) as predictor:
+        batch = predictor.predict(X)
+        assert np.allclose(batch, store.load(key)['model'].predict(X_test))
+        print(f"Single mix: {predictor.predict(X[0]):.2f} MPa")
+
+        predictor.latencies.clear()
+        throughput = simulate_clients(predictor, X)
+        print(f"Micro-batched: {throughput:,.0f} requests/s, latency (ms): "
+              + ", ".join(f"{k}={v:.3f}" for k, v in predictor.percentiles().items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import re
+import time
+
+import pandas as pd
+
+from text_preprocessing import TextPreprocessor, load_stopwords
+
+
+# Original lab6 implementation, kept as the reference. The stopword list is
+# fetched again for every word, as stopwords.words('english') was.
+def preprocess_text_reference(text, stopwords_loader=load_stopwords):
+    text = text.lower()
+    text = re.sub(r'\b(?:rfi|cmu|sf|lf|psi|sqft|typ|w\/|n\/a|tbd)\b', '', text)  # remove construction abbreviations
+    text = re.sub(r'[\d]+(?:[\./][\d]+)*\s*(mm|cm|m|ft|in|kg|lb|psi|sqm|sqft|sf|lf)', '', text)  # remove units
+    text = re.sub(r'[^a-z\s]', '', text)
+    text = ' '.join([word for word in text.split() if word not in stopwords_loader('english')])
+    return text
+
+
+# Corpus of n_docs documents made by repeating the lab6 documents
+def scale_corpus(texts, n_docs):
+    texts = pd.Series(texts)
+    repeats = -(-n_docs // len(texts))
+    return pd.concat([texts] * repeats, ignore_index=True).iloc[:n_docs]
+
+
+def run_benchmark(texts, n_docs=1_000_000, reference_docs=2_000, stopwords_loader=load_stopwords):
+    """
+    Time the original function on a sample (extrapolated to n_docs) and the
+    TextPreprocessor per document and per batch on the full corpus.
+    """
+    corpus = scale_corpus(texts, n_docs)
+    preprocessor = TextPreprocessor(stopwords_loader('english'))
+    timings = {}
+
+    sample = corpus.iloc[:reference_docs]
+    start = time.perf_counter()
+    expected = sample.apply(preprocess_text_reference, stopwords_loader=stopwords_loader)
+    timings['original (extrapolated)'] = (time.perf_counter() - start) * n_docs / len(sample)
+
+    start = time.perf_counter()
+    corpus.apply(preprocessor.clean)
+    timings['TextPreprocessor.clean per document'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cleaned = preprocessor.transform(corpus)
+    timings['TextPreprocessor.transform'] = time.perf_counter() - start
+
+    if not cleaned.iloc[:reference_docs].equals(expected):
+        raise AssertionError("TextPreprocessor output differs from the original preprocess_text")
+
+    report = pd.DataFrame.from_dict(timings, orient='index', columns=['seconds'])
+    report['speedup'] = report['seconds'].iloc[0] / report['seconds']
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark lab6 text preprocessing.')
+    parser.add_argument('--docs', type=int, default=1_000_000)
+    parser.add_argument('--reference-docs', type=int, default=2_000,
+                        help='documents timed with the original function')
+    args = parser.parse_args()
+
+    texts = pd.read_json('construction_documents.json')['content']
+    report = run_benchmark(texts, args.docs, args.reference_docs)
+    print(f"{args.docs:,} documents:")
+    print(report.round(2).to_string())
+    print("Outputs match on the reference sample.")
+
+
+if __name__ == '__main__':
+    main()
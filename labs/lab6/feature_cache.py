@@ -0,0 +1,164 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.feature_extraction import DictVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.impute import SimpleImputer
+
+from text_preprocessing import ABBREVIATIONS, NON_LETTERS, UNITS, TextPreprocessor, load_stopwords
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".feature_cache"
+CACHE_VERSION = 1
+META_COLUMNS = ['project_phase', 'author_role']
+TEXT_COLUMN = 'content'
+LABEL_COLUMN = 'document_type'
+
+
+# SHA-256 of the documents (text, metadata, labels) and of every setting that
+# changes the features: stopwords, cleaning patterns and vectorizer options
+def feature_key(df, stop_words, max_features=5000, meta_columns=META_COLUMNS):
+    digest = hashlib.sha256()
+    columns = [TEXT_COLUMN, *meta_columns, LABEL_COLUMN]
+    digest.update(pd.util.hash_pandas_object(df[columns], index=False).to_numpy().tobytes())
+    config = {
+        'columns': columns,
+        'stop_words': sorted(stop_words),
+        'patterns': [ABBREVIATIONS, UNITS, NON_LETTERS],
+        'max_features': max_features,
+    }
+    digest.update(json.dumps(config, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+# lab6 steps 2-6: impute and one-hot encode the metadata, clean the text,
+# TF-IDF it and stack both. With parallel=True, cleaning and counting run in a
+# process pool (same result). Returns (X, y, state) where state holds what is
+# needed to transform new documents the same way.
+def build_features(df, stop_words, max_features=5000, meta_columns=META_COLUMNS, parallel=False,
+                   max_workers=None):
+    meta_columns = list(meta_columns)
+    imputer = SimpleImputer(strategy='most_frequent')
+    meta = pd.DataFrame(imputer.fit_transform(df[meta_columns]), columns=meta_columns)
+    dict_vectorizer = DictVectorizer()
+    meta_features = dict_vectorizer.fit_transform(meta.to_dict(orient='records'))
+
+    if parallel:
+        from parallel_features import parallel_tfidf
+
+        text_features, vocabulary, transformer = parallel_tfidf(df[TEXT_COLUMN], stop_words, max_features,
+                                                                max_workers=max_workers)
+        feature_names = np.array(sorted(vocabulary, key=vocabulary.get), dtype=str)
+        idf = transformer.idf_
+    else:
+        clean_text = TextPreprocessor(stop_words).transform(df[TEXT_COLUMN])
+        vectorizer = TfidfVectorizer(max_features=max_features)
+        text_features = vectorizer.fit_transform(clean_text)
+        feature_names = vectorizer.get_feature_names_out().astype(str)
+        idf = vectorizer.idf_
+
+    X = sp.hstack([text_features, meta_features], format='csr')
+    y = df[LABEL_COLUMN].to_numpy().astype(str)
+    state = {'feature_names': feature_names, 'idf': idf,
+             'imputer': imputer, 'dict_vectorizer': dict_vectorizer}
+    return X, y, state
+
+
+def _entry_dir(cache_dir, key):
+    return Path(cache_dir) / f"v{CACHE_VERSION}" / key
+
+
+# The CSR arrays, labels, feature names and idf weights are plain .npy files
+# (memory-mapped on load, so reloading does not depend on the corpus size);
+# the fitted imputer and DictVectorizer are pickled with joblib. Entries are
+# written to a temporary folder and renamed into place.
+def write_features(cache_dir, key, X, y, state):
+    entry = _entry_dir(cache_dir, key)
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=entry.parent, prefix=".tmp-"))
+    try:
+        arrays = {'data': X.data, 'indices': X.indices, 'indptr': X.indptr, 'labels': y,
+                  'feature_names': state['feature_names'], 'idf': state['idf']}
+        for name, values in arrays.items():
+            np.save(tmp / f"{name}.npy", values, allow_pickle=False)
+        joblib.dump({'imputer': state['imputer'], 'dict_vectorizer': state['dict_vectorizer']},
+                    tmp / "encoders.joblib")
+        with open(tmp / "meta.json", "w") as f:
+            json.dump({"shape": list(X.shape)}, f)
+        try:
+            os.replace(tmp, entry)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(tmp, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    return entry
+
+
+# Read a cached entry; returns None on a miss
+def read_features(cache_dir, key):
+    entry = _entry_dir(cache_dir, key)
+    meta_path = entry / "meta.json"
+    if not meta_path.exists():
+        return None
+    with open(meta_path) as f:
+        meta = json.load(f)
+    arrays = {name: np.load(entry / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+              for name in ('data', 'indices', 'indptr', 'labels', 'feature_names', 'idf')}
+    X = sp.csr_matrix((arrays['data'], arrays['indices'], arrays['indptr']),
+                      shape=tuple(meta["shape"]), copy=False)
+    state = dict(joblib.load(entry / "encoders.joblib"),
+                 feature_names=arrays['feature_names'], idf=arrays['idf'])
+    return X, arrays['labels'], state
+
+
+def cached_features(df, stop_words, max_features=5000, meta_columns=META_COLUMNS, parallel=False,
+                    max_workers=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    build_features(), but stored on disk under a hash of the corpus and the
+    settings, so experiments that only change the classifier skip cleaning,
+    TF-IDF fitting and stacking.
+    """
+    key = feature_key(df, stop_words, max_features, meta_columns)
+    cached = read_features(cache_dir, key)
+    if cached is not None:
+        return cached
+    X, y, state = build_features(df, stop_words, max_features, meta_columns, parallel, max_workers)
+    write_features(cache_dir, key, X, y, state)
+    return X, y, state
+
+
+def clear_cache(cache_dir=DEFAULT_CACHE_DIR):
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and reload cached lab6 features.')
+    parser.add_argument('--docs', type=int, default=1_000_000)
+    parser.add_argument('--parallel', action='store_true')
+    args = parser.parse_args()
+
+    from benchmark_preprocessing import scale_corpus
+
+    df = pd.read_json('construction_documents.json')
+    df = df.loc[scale_corpus(df.index, args.docs)].reset_index(drop=True)
+    stop_words = load_stopwords()
+
+    for label in ('First run (build + store)', 'Second run (reload)'):
+        start = time.perf_counter()
+        X, _, _ = cached_features(df, stop_words, parallel=args.parallel)
+        print(f"{label}: {time.perf_counter() - start:.2f} s, {X.shape[0]:,} x {X.shape[1]:,}")
+
+
+if __name__ == '__main__':
+    main()
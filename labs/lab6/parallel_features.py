@@ -0,0 +1,169 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+
+from text_preprocessing import TextPreprocessor, load_stopwords
+
+# Per-worker preprocessor, built once by the pool initializer
+_preprocessor = None
+
+
+def _init_worker(stop_words):
+    global _preprocessor
+    _preprocessor = TextPreprocessor(stop_words)
+
+
+def _count_chunk(texts, count_params, return_text):
+    # Same counting loop as CountVectorizer: term ids in order of first
+    # appearance, one {term id: count} dict per document
+    cleaned = _preprocessor.clean_batch(texts)
+    analyze = CountVectorizer(**count_params).build_analyzer()
+    vocabulary = {}
+    indices, values, indptr = [], [], [0]
+    for doc in cleaned:
+        counter = {}
+        for term in analyze(doc):
+            idx = vocabulary.setdefault(term, len(vocabulary))
+            counter[idx] = counter.get(idx, 0) + 1
+        indices.extend(counter)
+        values.extend(counter.values())
+        indptr.append(len(indices))
+    # Float counts, as TfidfVectorizer builds them: converting an integer
+    # matrix later would sort the row entries and change the summation order
+    counts = (np.array(values, dtype=np.float64), np.array(indices, dtype=np.int64),
+              np.array(indptr, dtype=np.int64))
+    return list(vocabulary), counts, cleaned if return_text else None
+
+
+def merge_counts(parts):
+    """
+    Stack per-chunk (terms, (data, indices, indptr)) results into one count
+    matrix over the union vocabulary. Returns (sorted terms, csr counts).
+
+    Entries are laid out exactly as CountVectorizer lays them out (rows sorted
+    by first appearance in the corpus, then renumbered alphabetically), so the
+    TF-IDF normalization sums in the same order and the result is identical
+    to the serial fit, not just close.
+    """
+    first_seen = {}
+    mappings = [np.array([first_seen.setdefault(term, len(first_seen)) for term in terms],
+                         dtype=np.int64)
+                for terms, _ in parts]
+    if not first_seen:
+        raise ValueError("empty vocabulary; perhaps the documents only contain stop words")
+
+    n_terms = len(first_seen)
+    n_entries = sum(len(data) for _, (data, _, _) in parts)
+    index_dtype = np.int32 if n_entries <= np.iinfo(np.int32).max else np.int64
+    blocks = [sp.csr_matrix((data, mapping[indices].astype(index_dtype), indptr.astype(index_dtype)),
+                            shape=(len(indptr) - 1, n_terms))
+              for (_, (data, indices, indptr)), mapping in zip(parts, mappings)]
+    counts = sp.vstack(blocks, format='csr')
+    counts.sort_indices()
+
+    terms = np.array(list(first_seen), dtype=object)
+    order = np.argsort(terms.astype(str), kind='stable')
+    alphabetical = np.empty(n_terms, dtype=counts.indices.dtype)
+    alphabetical[order] = np.arange(n_terms, dtype=counts.indices.dtype)
+    counts.indices = alphabetical.take(counts.indices, mode='clip')
+    counts.has_sorted_indices = False
+    return terms[order], counts
+
+
+def limit_features(counts, terms, max_features):
+    """Keep the max_features most frequent terms, with CountVectorizer's tie-breaking."""
+    if max_features is None or len(terms) <= max_features:
+        return counts, terms
+    totals = np.asarray(counts.sum(axis=0)).ravel()
+    kept = np.sort((-totals).argsort()[:max_features])
+    return counts[:, kept], terms[kept]
+
+
+def parallel_tfidf(texts, stop_words, max_features=None, max_workers=None, chunk_size=20_000,
+                   count_params=None, tfidf_params=None, return_text=False):
+    """
+    Clean and count documents in worker processes, then merge the chunk
+    vocabularies and apply TF-IDF weighting once.
+
+    Gives the same matrix and vocabulary as
+    TfidfVectorizer(max_features=max_features).fit_transform(cleaned texts).
+    Returns (tfidf matrix, vocabulary dict, fitted TfidfTransformer) plus the
+    cleaned texts when return_text is True.
+    """
+    texts = list(texts)
+    count_params = count_params or {}
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    args = ([count_params] * len(chunks), [return_text] * len(chunks))
+
+    if max_workers == 1:
+        _init_worker(stop_words)
+        parts = list(map(_count_chunk, chunks, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(list(stop_words),)) as executor:
+            parts = list(executor.map(_count_chunk, chunks, *args))
+
+    terms, counts = merge_counts([(chunk_terms, counts) for chunk_terms, counts, _ in parts])
+    counts, terms = limit_features(counts, terms, max_features)
+    transformer = TfidfTransformer(**(tfidf_params or {}))
+    tfidf = transformer.fit_transform(counts)
+    vocabulary = {term: i for i, term in enumerate(terms.tolist())}
+
+    if return_text:
+        cleaned = [text for _, _, chunk_text in parts for text in chunk_text]
+        return tfidf, vocabulary, transformer, cleaned
+    return tfidf, vocabulary, transformer
+
+
+# Serial reference (TextPreprocessor + TfidfVectorizer) against the process
+# pool for each worker count, on construction_documents.json scaled to n_docs
+def benchmark_scaling(texts, stop_words, n_docs=200_000, workers=(1, 2, 4, 8), max_features=5000):
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    from benchmark_preprocessing import scale_corpus
+
+    corpus = scale_corpus(texts, n_docs).tolist()
+    start = time.perf_counter()
+    cleaned = TextPreprocessor(stop_words).clean_batch(corpus)
+    vectorizer = TfidfVectorizer(max_features=max_features)
+    expected = vectorizer.fit_transform(cleaned)
+    timings = {'serial': time.perf_counter() - start}
+
+    for n in workers:
+        start = time.perf_counter()
+        tfidf, vocabulary, _ = parallel_tfidf(corpus, stop_words, max_features, max_workers=n,
+                                              chunk_size=max(1_000, -(-n_docs // (4 * n))))
+        timings[f'{n} workers'] = time.perf_counter() - start
+        identical = (vocabulary == vectorizer.vocabulary_
+                     and np.array_equal(tfidf.indptr, expected.indptr)
+                     and np.array_equal(tfidf.indices, expected.indices)
+                     and np.array_equal(tfidf.data, expected.data))
+        if not identical:
+            raise AssertionError(f"Parallel output with {n} workers differs from TfidfVectorizer")
+
+    report = pd.DataFrame.from_dict(timings, orient='index', columns=['seconds'])
+    report['speedup'] = report['seconds'].iloc[0] / report['seconds']
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scaling of parallel lab6 text vectorization.')
+    parser.add_argument('--docs', type=int, default=200_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    texts = pd.read_json('construction_documents.json')['content']
+    report = benchmark_scaling(texts, load_stopwords(), args.docs, args.workers)
+    print(f"{args.docs:,} documents on {os.cpu_count()} CPUs:")
+    print(report.round(2).to_string())
+    print("Parallel output is identical to TfidfVectorizer.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+import argparse
+import time
+import tracemalloc
+import zlib
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import hstack
+from sklearn.feature_extraction import DictVectorizer, FeatureHasher
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.impute import SimpleImputer
+from sklearn.metrics import accuracy_score
+from sklearn.naive_bayes import MultinomialNB
+
+from text_preprocessing import TextPreprocessor, load_stopwords
+
+META_COLUMNS = ['project_phase', 'author_role']
+
+
+def iter_batches(path, batch_size=10_000):
+    """
+    Yield DataFrames of at most batch_size documents.
+
+    JSON Lines files (.jsonl) are read incrementally; a plain JSON array such
+    as construction_documents.json has to be parsed in one go first.
+    """
+    if str(path).endswith('.jsonl'):
+        with pd.read_json(path, lines=True, chunksize=batch_size) as reader:
+            yield from reader
+        return
+    df = pd.read_json(path)
+    for start in range(0, len(df), batch_size):
+        yield df.iloc[start:start + batch_size]
+
+
+# Stable train/test assignment from a document key, so a stream can be split
+# without knowing its length. Roughly test_fraction of the documents are test.
+def is_test(keys, test_fraction=0.2):
+    buckets = np.fromiter((zlib.crc32(str(key).encode()) % 1000 for key in keys), dtype=np.int64,
+                          count=len(keys))
+    return buckets < test_fraction * 1000
+
+
+class HashingFeaturizer:
+    """
+    Stateless features for streamed documents: hashed term frequencies of the
+    cleaned text plus hashed "column=value" tokens for the metadata. Nothing
+    is fitted, so every batch is transformed independently.
+    """
+
+    def __init__(self, preprocessor, n_features=2 ** 18, n_meta_features=2 ** 6,
+                 meta_columns=META_COLUMNS):
+        self.preprocessor = preprocessor
+        self.meta_columns = list(meta_columns)
+        self.text = HashingVectorizer(n_features=n_features, alternate_sign=False)
+        self.meta = FeatureHasher(n_features=n_meta_features, input_type='string',
+                                  alternate_sign=False)
+
+    def transform(self, batch):
+        text = self.text.transform(self.preprocessor.clean_batch(batch['content'].tolist()))
+        # Missing metadata becomes its own token instead of being imputed,
+        # since the most frequent value is not known up front
+        meta = batch[self.meta_columns].astype(object)
+        meta = meta.where(meta.notna(), '<missing>')
+        tokens = [[f'{col}={value}' for col, value in zip(self.meta_columns, row)]
+                  for row in meta.itertuples(index=False)]
+        return hstack([text, self.meta.transform(tokens)], format='csr')
+
+
+def train_streaming(batches, classes, featurizer, test_fraction=0.2, key='index', alpha=1.0):
+    """
+    partial_fit MultinomialNB batch by batch on the training documents.
+    Memory is bounded by the batch size and the hashed feature count, not by
+    the number of documents.
+    """
+    clf = MultinomialNB(alpha=alpha)
+    for batch in batches:
+        train = ~is_test(batch.index if key == 'index' else batch[key], test_fraction)
+        if train.any():
+            clf.partial_fit(featurizer.transform(batch[train]),
+                            batch['document_type'].to_numpy()[train], classes=classes)
+    return clf
+
+
+def evaluate_streaming(clf, batches, featurizer, test_fraction=0.2, key='index'):
+    """
+    Second pass over the stream that predicts the test documents and only
+    keeps a confusion matrix (classes x classes), so memory stays bounded.
+    """
+    index = {label: i for i, label in enumerate(clf.classes_)}
+    confusion = np.zeros((len(index), len(index)), dtype=np.int64)
+    for batch in batches:
+        test = is_test(batch.index if key == 'index' else batch[key], test_fraction)
+        if test.any():
+            y_true = batch['document_type'].to_numpy()[test]
+            y_pred = clf.predict(featurizer.transform(batch[test]))
+            np.add.at(confusion, ([index[y] for y in y_true], [index[y] for y in y_pred]), 1)
+    return pd.DataFrame(confusion, index=clf.classes_, columns=clf.classes_)
+
+
+# The lab6 in-memory pipeline (imputation, one-hot metadata, TF-IDF, fit) on
+# the same train/test assignment, as the accuracy baseline
+def train_in_memory(df, preprocessor, test_fraction=0.2, max_features=5000):
+    df = df.copy()
+    df[META_COLUMNS] = SimpleImputer(strategy='most_frequent').fit_transform(df[META_COLUMNS])
+    meta = DictVectorizer().fit_transform(df[META_COLUMNS].to_dict(orient='records'))
+    text = TfidfVectorizer(max_features=max_features).fit_transform(preprocessor.transform(df['content']))
+    X = hstack([text, meta], format='csr')
+    y = df['document_type'].to_numpy()
+
+    test = is_test(df.index, test_fraction)
+    clf = MultinomialNB().fit(X[~test], y[~test])
+    return clf, y[test], clf.predict(X[test])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Out-of-core Naive Bayes for construction documents.')
+    parser.add_argument('--data', default='construction_documents.json',
+                        help='JSON array or JSON Lines (.jsonl) file')
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--n-features', type=int, default=2 ** 18)
+    args = parser.parse_args()
+
+    # The class list has to be known before the first partial_fit; one cheap
+    # pass over the labels only
+    classes = np.unique(np.concatenate([batch['document_type'].dropna().unique()
+                                        for batch in iter_batches(args.data, 10_000)]))
+    preprocessor = TextPreprocessor(load_stopwords())
+    featurizer = HashingFeaturizer(preprocessor, n_features=args.n_features)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    clf = train_streaming(iter_batches(args.data, args.batch_size), classes, featurizer)
+    confusion = evaluate_streaming(clf, iter_batches(args.data, args.batch_size), featurizer)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    accuracy = np.trace(confusion.to_numpy()) / confusion.to_numpy().sum()
+    print(f"Streaming ({args.batch_size}-document batches): accuracy {accuracy:.3f}, "
+          f"{elapsed:.2f} s, peak traced memory {peak / 2 ** 20:.1f} MiB")
+
+    df = pd.read_json(args.data, lines=str(args.data).endswith('.jsonl'))
+    _, y_true, y_pred = train_in_memory(df, preprocessor)
+    print(f"In-memory TF-IDF baseline: accuracy {accuracy_score(y_true, y_pred):.3f}")
+
+
+if __name__ == '__main__':
+    main()
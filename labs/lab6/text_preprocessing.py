@@ -0,0 +1,97 @@
+import re
+
+import pandas as pd
+
+# Construction abbreviations and quantities with units are dropped before the
+# text is reduced to lowercase letters
+ABBREVIATIONS = r'\b(?:rfi|cmu|sf|lf|psi|sqft|typ|w\/|n\/a|tbd)\b'
+UNITS = r'[\d]+(?:[\./][\d]+)*\s*(mm|cm|m|ft|in|kg|lb|psi|sqm|sqft|sf|lf)'
+NON_LETTERS = r'[^a-z\s]'
+
+# Separates documents when a whole batch is cleaned as one string. It is not
+# whitespace, a digit or a letter, so none of the patterns can match across it.
+_SEPARATOR = '\x00'
+
+
+class _KeepLetters(dict):
+    # str.translate table equivalent to re.sub(NON_LETTERS, '', text): keeps
+    # a-z, whitespace and the extra characters in `keep`, deletes the rest.
+    # Entries are filled in lazily, the first time a character is seen.
+    def __init__(self, keep=''):
+        super().__init__()
+        self.keep = set(map(ord, keep))
+
+    def __missing__(self, code):
+        char = chr(code)
+        value = code if ('a' <= char <= 'z' or char.isspace() or code in self.keep) else None
+        self[code] = value
+        return value
+
+
+def load_stopwords(language='english'):
+    from nltk.corpus import stopwords
+    try:
+        return stopwords.words(language)
+    except LookupError:
+        import nltk
+        nltk.download('stopwords', quiet=True)
+        return stopwords.words(language)
+
+
+class TextPreprocessor:
+    """
+    Same cleaning as lab6's original preprocess_text, with the stopword set
+    and regexes built once.
+
+    The substitutions run once per batch on the documents joined with a NUL
+    separator, instead of once per document, and the final character filter
+    is a str.translate table rather than a regex. stop_words defaults to the
+    NLTK list for `language`; pass any iterable to use a different list.
+    """
+
+    def __init__(self, stop_words=None, language='english', batch_size=10_000):
+        if stop_words is None:
+            stop_words = load_stopwords(language)
+        self.stop_words = frozenset(stop_words)
+        self.batch_size = batch_size
+        self._abbreviations = re.compile(ABBREVIATIONS)
+        self._units = re.compile(UNITS)
+        self._non_letters = re.compile(NON_LETTERS)
+        self._batch_non_letters = _KeepLetters(keep=_SEPARATOR)
+
+    def _drop_stopwords(self, text):
+        stop_words = self.stop_words
+        return ' '.join([word for word in text.split() if word not in stop_words])
+
+    def clean(self, text):
+        """Clean a single document."""
+        text = text.lower()
+        text = self._abbreviations.sub('', text)
+        text = self._units.sub('', text)
+        text = self._non_letters.sub('', text)
+        return self._drop_stopwords(text)
+
+    def _clean_batch(self, texts):
+        if any(_SEPARATOR in text for text in texts):
+            return [self.clean(text) for text in texts]
+        joined = _SEPARATOR.join(texts).lower()
+        joined = self._abbreviations.sub('', joined)
+        joined = self._units.sub('', joined)
+        joined = joined.translate(self._batch_non_letters)
+        return [self._drop_stopwords(text) for text in joined.split(_SEPARATOR)]
+
+    def clean_batch(self, texts):
+        """Clean a list (or any iterable) of documents; returns a list."""
+        texts = list(texts)
+        cleaned = []
+        for start in range(0, len(texts), self.batch_size):
+            cleaned.extend(self._clean_batch(texts[start:start + self.batch_size]))
+        return cleaned
+
+    def transform(self, texts):
+        """Clean a Series (index preserved) or a list of documents."""
+        if isinstance(texts, pd.Series):
+            return pd.Series(self.clean_batch(texts.tolist()), index=texts.index, name=texts.name)
+        return self.clean_batch(texts)
+
+    __call__ = clean